@@ -0,0 +1,62 @@
+"""Measure import time of rich_typography in fresh interpreters.
+
+Usage:
+    python benchmarks/import_time.py [--runs 20]
+"""
+
+import subprocess
+import sys
+from argparse import ArgumentParser
+from statistics import median
+from time import perf_counter
+from typing import Dict, List
+
+STATEMENTS: Dict[str, str] = {
+    "baseline": "pass",
+    "import package": "import rich_typography",
+    "import Font": "from rich_typography import Font",
+    "import Typography": "from rich_typography import Typography",
+    "render banner": (
+        "from rich.console import Console\n"
+        "from rich_typography import Typography\n"
+        "Console(width=80).print(Typography('Banner'))"
+    ),
+}
+
+
+def measure(statement: str, runs: int) -> List[float]:
+    """Measure wall time of running a statement in new interpreters.
+
+    Args:
+        statement (str): Python statement.
+        runs (int): Number of interpreters to start.
+
+    Returns:
+        List[float]: Time per run in milliseconds.
+    """
+    timings = []
+    for _ in range(runs):
+        start = perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", statement], check=True, stdout=subprocess.DEVNULL
+        )
+        timings.append((perf_counter() - start) * 1000.0)
+    return timings
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="Runs per statement.")
+    args = parser.parse_args()
+    baseline = 0.0
+    for name, statement in STATEMENTS.items():
+        result = median(measure(statement, args.runs))
+        if name == "baseline":
+            baseline = result
+            print(f"{name:<20} {result:8.1f}ms")
+        else:
+            print(f"{name:<20} {result:8.1f}ms  (+{result - baseline:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
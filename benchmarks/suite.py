@@ -0,0 +1,433 @@
+"""Benchmark font loading, measuring, wrapping and rendering of rich_typography.
+
+Benchmarks run cold, clearing shaped runs and font memos before every call. Render
+benchmarks also run warm, reusing them as for repeated renders of similar text.
+
+Usage:
+    python benchmarks/suite.py [--filter render] [--min-time 0.05]
+    python benchmarks/suite.py --save baseline.json
+    python benchmarks/suite.py --compare baseline.json [--tolerance 0.25]
+"""
+
+import io
+import json
+import platform
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+from timeit import Timer
+from typing import Callable, Dict, Iterator, List, Optional
+
+from rich.console import Console
+from rich.text import Text
+
+from rich_typography import BatchItem, Font, Typography, render_batch
+from rich_typography.cache import font_cache, render_cache, shape_cache
+
+WORDS = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit. Quisque in metus sed "
+    "sapien ultricies pretium a at justo. Maecenas luctus velit et auctor maximus. "
+    "Office fira ffi suffix, the quick brown fox jumps over the lazy dog! "
+).split()
+
+SIZES: Dict[str, int] = {
+    "word": 1,
+    "sentence": 10,
+    "paragraph": 100,
+    "page": 800,
+}
+"""Number of words per text size. A page holds about 5 KB of text."""
+
+JUSTIFY = ["default", "left", "center", "right", "full"]
+OVERFLOW = ["fold", "crop", "ellipsis", "ignore"]
+STYLES = ["bold red", "italic blue on white", "underline", "strike green", "overline"]
+WIDTH = 120
+
+
+@dataclass
+class Result:
+    """Result of a benchmark."""
+
+    ops: float
+    """Operations per second."""
+    peak: int
+    """Peak memory allocated by a single operation in bytes."""
+    blocks: int
+    """Memory blocks allocated by a single operation and still alive after it."""
+    warm: bool = False
+    """Whether shaped runs and font memos were kept between operations."""
+
+
+@dataclass
+class Benchmark:
+    """A named operation to time."""
+
+    name: str
+    operation: Callable[[], object]
+    setup: Optional[Callable[[], object]] = None
+    """Called before every timed operation, like clearing caches."""
+    warm: bool = False
+    """Whether shaped runs and font memos are kept between operations."""
+
+    def run(self, min_time: float) -> Result:
+        """Time the operation and measure its allocations.
+
+        Args:
+            min_time (float): Time per repetition in seconds. The best of 3 repetitions is used.
+                Operations with setup are timed one at a time, using the best of as many.
+
+        Returns:
+            Result: Result of benchmark.
+        """
+        timer = Timer(self.operation, setup=self.setup or "pass")
+        elapsed = timer.timeit(number=1)
+        number = max(1, int(min_time / max(elapsed, 1e-9)))
+        if self.setup is None:
+            best = min(timer.repeat(repeat=3, number=number)) / number
+        else:
+            # Setup only runs once per repetition
+            best = min(timer.repeat(repeat=3 * number, number=1))
+            self.setup()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        self.operation()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        blocks = sum(d.count_diff for d in after.compare_to(before, "filename"))
+        return Result(1.0 / best, peak, max(blocks, 0), self.warm)
+
+
+def sample(words: int) -> str:
+    """Create sample text.
+
+    Args:
+        words (int): Number of words.
+
+    Returns:
+        str: Sample text.
+    """
+    return " ".join(WORDS[idx % len(WORDS)] for idx in range(words))
+
+
+def sample_markup(words: int) -> str:
+    """Create sample markup with a style span for every word.
+
+    Args:
+        words (int): Number of words.
+
+    Returns:
+        str: Sample markup.
+    """
+    return " ".join(
+        f"[{STYLES[idx % len(STYLES)]}]{WORDS[idx % len(WORDS)]}[/]"
+        for idx in range(words)
+    )
+
+
+def clear_caches(*fonts: Font) -> None:
+    """Clear shaped runs and the memos of fonts, as for text not rendered before.
+
+    Args:
+        *fonts (Font): Fonts to clear memos of.
+    """
+    shape_cache.clear()
+    for font in fonts:
+        font.clear_memos()
+
+
+def render(console: Console, typography: Typography) -> None:
+    """Render without the render cache, as for new text.
+
+    Args:
+        console (Console): Console instance.
+        typography (Typography): Typography to render.
+    """
+    render_cache.enabled = False
+    try:
+        for _ in console.render(typography, console.options):
+            pass
+    finally:
+        render_cache.enabled = True
+
+
+def batch(console: Console, items: List[BatchItem]) -> None:
+    """Render a batch without the render cache, as for new labels.
+
+    Args:
+        console (Console): Console instance.
+        items (List[BatchItem]): Items to render.
+    """
+    render_cache.enabled = False
+    try:
+        render_batch(console, items)
+    finally:
+        render_cache.enabled = True
+
+
+def load(name: str) -> Font:
+    """Load a font without the font cache.
+
+    Args:
+        name (str): Font name.
+
+    Returns:
+        Font: Loaded font.
+    """
+    font_cache.enabled = False
+    try:
+        return Font.from_file(name)
+    finally:
+        font_cache.enabled = True
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    """Create all benchmarks.
+
+    Yields:
+        Benchmark: Benchmark.
+    """
+    console = Console(file=io.StringIO(), width=WIDTH, force_terminal=True)
+    fonts = sorted(Font.get_font_names())
+    for font in fonts:
+        yield Benchmark(f"from_file[{font}]", lambda font=font: load(font))
+    for font in fonts:
+        for size, words in SIZES.items():
+            text = sample(words)
+            typography = Typography(text, font=font)
+            cold = partial(clear_caches, typography.font)
+            case = f"{font},{size}"
+            yield Benchmark(
+                f"rendered_width[{case}]",
+                lambda t=typography, text=text: t.rendered_width(text),
+                cold,
+            )
+            yield Benchmark(
+                f"split_glyphs[{case}]",
+                lambda t=typography, text=text: t.split_glyphs(text),
+            )
+            yield Benchmark(
+                f"wrap[{case}]", lambda t=typography: list(t.wrap(WIDTH)), cold
+            )
+            yield Benchmark(
+                f"truncate[{case}]",
+                lambda t=typography: t.copy().truncate(40, overflow="ellipsis"),
+                cold,
+            )
+            yield Benchmark(
+                f"render[{case}]", lambda t=typography: render(console, t), cold
+            )
+            yield Benchmark(
+                f"render_warm[{case}]",
+                lambda t=typography: render(console, t),
+                warm=True,
+            )
+            yield Benchmark(
+                f"measure[{case}]",
+                lambda t=typography: t.__rich_measure__(console, console.options),
+                cold,
+            )
+    text = sample(SIZES["paragraph"])
+    for justify in JUSTIFY:
+        for overflow in OVERFLOW:
+            typography = Typography(
+                text,
+                justify=justify,  # type: ignore[arg-type]
+                overflow=overflow,  # type: ignore[arg-type]
+            )
+            yield Benchmark(
+                f"render[{justify},{overflow}]",
+                lambda t=typography: render(console, t),
+                partial(clear_caches, typography.font),
+            )
+    for size, words in SIZES.items():
+        typography = Typography.from_text(Text.from_markup(sample_markup(words)))
+        cold = partial(clear_caches, typography.font)
+        yield Benchmark(
+            f"render_markup[{size}]", lambda t=typography: render(console, t), cold
+        )
+        yield Benchmark(
+            f"render_markup_warm[{size}]",
+            lambda t=typography: render(console, t),
+            warm=True,
+        )
+        yield Benchmark(
+            f"measure_markup[{size}]",
+            lambda t=typography: t.__rich_measure__(console, console.options),
+            cold,
+        )
+    labels = [
+        BatchItem(f"[{STYLES[idx % len(STYLES)]}]{WORDS[idx % 20]}[/]", markup=True)
+        for idx in range(200)
+    ]
+    yield Benchmark(
+        "render_batch[labels]",
+        lambda: batch(console, labels),
+        partial(clear_caches, Typography("").font),
+    )
+    yield Benchmark(
+        "render_batch_warm[labels]", lambda: batch(console, labels), warm=True
+    )
+
+
+def run(min_time: float = 0.05, name_filter: Optional[str] = None) -> Dict[str, Result]:
+    """Run benchmarks, printing results as they finish.
+
+    Args:
+        min_time (float, optional): Time per repetition in seconds. Defaults to 0.05.
+        name_filter (str, optional): Only run benchmarks containing this in their name. Defaults to None.
+
+    Returns:
+        Dict[str, Result]: Results by benchmark name.
+    """
+    results: Dict[str, Result] = {}
+    print(f"{'benchmark':<50} {'ops/sec':>12} {'peak KiB':>10} {'blocks':>8}")
+    for benchmark in benchmarks():
+        if name_filter and name_filter not in benchmark.name:
+            continue
+        result = benchmark.run(min_time)
+        results[benchmark.name] = result
+        print(
+            f"{benchmark.name:<50} {result.ops:>12,.1f} "
+            f"{result.peak / 1024:>10.1f} {result.blocks:>8}",
+            flush=True,
+        )
+    return results
+
+
+def save_baseline(path: Path, results: Dict[str, Result]) -> None:
+    """Save results as baseline.
+
+    Args:
+        path (Path): Path to JSON file.
+        results (Dict[str, Result]): Results by benchmark name.
+    """
+    data = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: Path) -> Dict[str, Result]:
+    """Load results from baseline.
+
+    Args:
+        path (Path): Path to JSON file.
+
+    Returns:
+        Dict[str, Result]: Results by benchmark name.
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {name: Result(**result) for name, result in data["results"].items()}
+
+
+def compare(
+    baseline: Dict[str, Result],
+    results: Dict[str, Result],
+    tolerance: float,
+    memory_tolerance: Optional[float] = None,
+) -> List[str]:
+    """Compare results to a baseline, printing a report for every benchmark.
+    Only cold benchmarks are gated. Warm benchmarks are reported separately.
+
+    Args:
+        baseline (Dict[str, Result]): Baseline results by benchmark name.
+        results (Dict[str, Result]): Results by benchmark name.
+        tolerance (float): Accepted relative loss of operations per second.
+        memory_tolerance (float, optional): Accepted relative growth of peak memory. Defaults to None, for no limit.
+
+    Returns:
+        List[str]: Names of cold benchmarks that regressed.
+    """
+    regressions = []
+    for warm in [False, True]:
+        names = [name for name, result in results.items() if result.warm == warm]
+        if not names:
+            continue
+        title = "warm benchmark (not gated)" if warm else "benchmark"
+        if warm:
+            print()
+        print(f"{title:<50} {'baseline':>12} {'current':>12} {'change':>8}  status")
+        for name in names:
+            result = results[name]
+            base = baseline.get(name)
+            if base is None:
+                print(f"{name:<50} {'-':>12} {result.ops:>12,.1f} {'-':>8}  new")
+                continue
+            change = result.ops / base.ops - 1.0
+            status = "ok"
+            if change < -tolerance:
+                status = "SLOWER"
+            elif memory_tolerance is not None and result.peak > base.peak * (
+                1.0 + memory_tolerance
+            ):
+                status = (
+                    f"MEMORY {base.peak / 1024:.1f} -> {result.peak / 1024:.1f} KiB"
+                )
+            if status != "ok" and not warm:
+                regressions.append(name)
+            print(
+                f"{name:<50} {base.ops:>12,.1f} {result.ops:>12,.1f} "
+                f"{change:>+8.1%}  {status}"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", help="Only run benchmarks containing this text.")
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="Time per repetition in seconds. The best of 3 repetitions is used.",
+    )
+    parser.add_argument("--save", type=Path, help="Save results as baseline.")
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="Compare results to baseline and fail on regressions of cold benchmarks.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Accepted relative loss of operations per second. Defaults to 0.25.",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=None,
+        help="Accepted relative growth of peak memory. Not checked by default.",
+    )
+    args = parser.parse_args(argv)
+    results = run(args.min_time, args.filter)
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"Saved baseline to {args.save}")
+    if args.compare:
+        print()
+        regressions = compare(
+            load_baseline(args.compare),
+            results,
+            args.tolerance,
+            args.memory_tolerance,
+        )
+        cold = [name for name, result in results.items() if not result.warm]
+        if regressions:
+            print(f"\n{len(regressions)} of {len(cold)} cold benchmarks regressed:")
+            for name in regressions:
+                print(f"  {name}")
+            return 1
+        print(f"\nNo regressions in {len(cold)} cold benchmarks.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,13 +1,57 @@
-from .typography import Typography
-from .font import Font
-from .glyph import Glyphs
-from .line import LineStyle, LineType
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .typography import Typography
+    from .font import Font
+    from .glyph import Glyphs
+    from .line import LineStyle, LineType
+    from .counters import reset_stats, stats
+    from .parallel import ParallelTypography
+    from .batch import BatchItem, render_batch
+    from .async_render import iter_lines_async, render_lines_async
 
 
 __all__ = [
     "Typography",
+    "ParallelTypography",
+    "BatchItem",
+    "render_batch",
+    "iter_lines_async",
+    "render_lines_async",
     "Font",
     "Glyphs",
     "LineStyle",
     "LineType",
+    "stats",
+    "reset_stats",
 ]
+
+# Attributes are imported on first access, so importing the package stays cheap
+_LAZY_ATTRIBUTES = {
+    "Typography": ".typography",
+    "ParallelTypography": ".parallel",
+    "BatchItem": ".batch",
+    "render_batch": ".batch",
+    "iter_lines_async": ".async_render",
+    "render_lines_async": ".async_render",
+    "Font": ".font",
+    "Glyphs": ".glyph",
+    "LineStyle": ".line",
+    "LineType": ".line",
+    "stats": ".counters",
+    "reset_stats": ".counters",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,102 @@
+import asyncio
+from concurrent.futures import Executor
+from threading import Event
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, List, Optional
+
+from rich.segment import Segment
+
+if TYPE_CHECKING:
+    from rich.console import Console, ConsoleOptions, RenderableType
+
+DEFAULT_ROWS_PER_YIELD = 8
+"""Number of rows rendered between handing control back to the event loop."""
+
+
+def _iter_lines(
+    console: "Console",
+    renderable: "RenderableType",
+    options: Optional["ConsoleOptions"],
+) -> Iterable[List[Segment]]:
+    render_options = options or console.options
+    return Segment.split_and_crop_lines(
+        console.render(renderable, render_options),
+        render_options.max_width,
+        include_new_lines=False,
+        pad=False,
+    )
+
+
+async def iter_lines_async(
+    console: "Console",
+    renderable: "RenderableType",
+    options: Optional["ConsoleOptions"] = None,
+    *,
+    rows_per_yield: int = DEFAULT_ROWS_PER_YIELD,
+) -> AsyncIterator[List[Segment]]:
+    """Render to lines of Segments, handing control back to the event loop every few rows.
+    Rows are rendered as they are consumed, so cancelling the consuming task stops rendering.
+    Control is only handed back between rows, so a single wide or slow line of text still
+    blocks the event loop until all of its rows are rendered.
+
+    Args:
+        console (Console): Console instance.
+        renderable (RenderableType): Typography or any other renderable.
+        options (ConsoleOptions, optional): Render options. Defaults to None, to use the options of the console.
+        rows_per_yield (int, optional): Number of rows between yields to the event loop. Defaults to 8.
+
+    Yields:
+        List[Segment]: Segments of a row, without new line.
+    """
+    for count, line in enumerate(_iter_lines(console, renderable, options), 1):
+        yield line
+        if count % rows_per_yield == 0:
+            await asyncio.sleep(0)
+
+
+async def render_lines_async(
+    console: "Console",
+    renderable: "RenderableType",
+    options: Optional["ConsoleOptions"] = None,
+    *,
+    rows_per_yield: int = DEFAULT_ROWS_PER_YIELD,
+    executor: Optional[Executor] = None,
+) -> List[List[Segment]]:
+    """Render to lines of Segments without blocking the event loop.
+    Rendering either runs in the event loop, handing control back every few rows,
+    or in an executor, which stops between rows once the awaiting task is cancelled.
+    Without an executor, a single wide or slow line of text blocks the event loop until all
+    of its rows are rendered.
+
+    Args:
+        console (Console): Console instance.
+        renderable (RenderableType): Typography or any other renderable.
+        options (ConsoleOptions, optional): Render options. Defaults to None, to use the options of the console.
+        rows_per_yield (int, optional): Number of rows between yields to the event loop. Defaults to 8.
+        executor (Executor, optional): Render in this executor. Defaults to None, to render in the event loop.
+
+    Returns:
+        List[List[Segment]]: Segments of every row, without new lines.
+    """
+    if executor is None:
+        return [
+            line
+            async for line in iter_lines_async(
+                console, renderable, options, rows_per_yield=rows_per_yield
+            )
+        ]
+    cancelled = Event()
+
+    def render() -> List[List[Segment]]:
+        lines = []
+        for line in _iter_lines(console, renderable, options):
+            if cancelled.is_set():
+                break
+            lines.append(line)
+        return lines
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, render)
+    except asyncio.CancelledError:
+        cancelled.set()
+        raise
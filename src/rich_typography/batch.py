@@ -0,0 +1,123 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Union,
+)
+
+from rich.style import Style
+
+from rich_typography.font import Font
+from rich_typography.typography import DEFAULT_FONT, Typography
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.segment import Segment
+
+
+class BatchItem(NamedTuple):
+    """A text to render in a batch."""
+
+    text: str
+    """Text, or console markup if markup is enabled."""
+    style: Union[str, Style] = ""
+    """Base style for text."""
+    markup: bool = False
+    """Parse text as console markup."""
+    width: Optional[int] = None
+    """Number of cells available, or None to use the width of the console."""
+    options: Optional[Dict[str, Any]] = None
+    """Keyword arguments of Typography, or of Typography.from_markup if markup is enabled."""
+
+
+def render_batch(
+    console: "Console",
+    items: Iterable[Union[BatchItem, str]],
+    *,
+    max_workers: Optional[int] = None,
+) -> List[List[List["Segment"]]]:
+    """Render many texts, sharing work between them.
+    Fonts and styles are resolved once per batch, equal items are rendered once,
+    and shaped runs and kerning are shared through the font and shape caches.
+
+    Args:
+        console (Console): Console instance.
+        items (Iterable[Union[BatchItem, str]]): Items to render. Strings are rendered with default settings.
+        max_workers (int, optional): Render items in a thread pool of this size. Defaults to None, to render in the calling thread.
+
+    Returns:
+        List[List[List[Segment]]]: Rows of Segments for every item, in order of items. Equal items are rendered once, and get copies of the same rows.
+    """
+    fonts: Dict[Hashable, Font] = {}
+    styles: Dict[Hashable, Style] = {}
+    typographies: List[Typography] = []
+    widths: List[int] = []
+    indices: List[int] = []
+    unique: Dict[Hashable, int] = {}
+    for item in items:
+        if isinstance(item, str):
+            item = BatchItem(item)
+        width = console.width if item.width is None else item.width
+        item_options = item.options or {}
+        try:
+            key: Optional[Hashable] = (
+                item.text,
+                item.style,
+                item.markup,
+                width,
+                tuple(sorted(item_options.items())),
+            )
+            hash(key)
+        except TypeError:
+            key = None
+        if key is not None and key in unique:
+            indices.append(unique[key])
+            continue
+        options = dict(item_options)
+        font = options.pop("font", DEFAULT_FONT)
+        if not isinstance(font, Font):
+            if font not in fonts:
+                fonts[font] = Font.from_file(font)
+            font = fonts[font]
+        style = item.style
+        if isinstance(style, str):
+            if style not in styles:
+                styles[style] = console.get_style(style)
+            style = styles[style]
+        if item.markup:
+            typography = Typography.from_markup(
+                item.text, style=style, font=font, **options
+            )
+        else:
+            typography = Typography(item.text, style=style, font=font, **options)
+        if key is not None:
+            unique[key] = len(typographies)
+        indices.append(len(typographies))
+        typographies.append(typography)
+        widths.append(width)
+
+    def render(typography: Typography, width: int) -> List[List["Segment"]]:
+        return console.render_lines(
+            typography, console.options.update_width(width), pad=False
+        )
+
+    if max_workers is None:
+        rendered = [render(*d) for d in zip(typographies, widths)]
+    else:
+        with ThreadPoolExecutor(max_workers) as executor:
+            rendered = list(executor.map(render, typographies, widths))
+    result: List[List[List["Segment"]]] = []
+    seen: Set[int] = set()
+    for index in indices:
+        rows = rendered[index]
+        # Duplicates get their own list, so changing one result leaves the others intact
+        result.append([list(row) for row in rows] if index in seen else rows)
+        seen.add(index)
+    return result
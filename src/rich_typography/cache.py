@@ -0,0 +1,222 @@
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from threading import RLock
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from rich.segment import Segment
+
+    from rich_typography.font import Font
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """A thread-safe least recently used cache, bounded by number of entries and estimated memory.
+
+    Args:
+        max_entries (int, optional): Maximum number of entries. Defaults to None, for no limit.
+        max_memory (int, optional): Maximum estimated memory in bytes. Defaults to None, for no limit.
+        sizeof (Callable[[V], int], optional): Estimate memory of a value in bytes. Defaults to sys.getsizeof.
+        enabled (bool, optional): Enable caching. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_memory: Optional[int] = None,
+        sizeof: Callable[[V], int] = sys.getsizeof,
+        enabled: bool = True,
+    ) -> None:
+        self._entries: "OrderedDict[Hashable, V]" = OrderedDict()
+        self._sizes: dict = {}
+        self._max_entries = max_entries
+        self._max_memory = max_memory
+        self._sizeof = sizeof
+        self._memory = 0
+        self._lock = RLock()
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        """Maximum number of entries, or None for no limit."""
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, max_entries: Optional[int]) -> None:
+        with self._lock:
+            self._max_entries = max_entries
+            self._evict()
+
+    @property
+    def max_memory(self) -> Optional[int]:
+        """Maximum estimated memory in bytes, or None for no limit."""
+        return self._max_memory
+
+    @max_memory.setter
+    def max_memory(self, max_memory: Optional[int]) -> None:
+        with self._lock:
+            self._max_memory = max_memory
+            self._evict()
+
+    @property
+    def memory(self) -> int:
+        """Estimated memory of all cached values in bytes."""
+        return self._memory
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Get a cached value and mark it as recently used.
+
+        Args:
+            key (Hashable): Cache key.
+
+        Returns:
+            Optional[V]: Cached value, or None if not cached or caching is disabled.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Cache a value, evicting the least recently used values if over limits.
+        Values larger than the memory limit are not cached.
+
+        Args:
+            key (Hashable): Cache key.
+            value (V): Value.
+        """
+        if not self.enabled:
+            return
+        size = self._sizeof(value)
+        if self._max_memory is not None and size > self._max_memory:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._memory -= self._sizes[key]
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            self._memory += size
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._memory = 0
+
+    def reset_stats(self) -> None:
+        """Reset hits, misses and evictions to zero."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self._max_entries is not None and len(self._entries) > self._max_entries)
+            or (self._max_memory is not None and self._memory > self._max_memory)
+        ):
+            key, _ = self._entries.popitem(last=False)
+            self._memory -= self._sizes.pop(key)
+            self.evictions += 1
+
+
+class FontCache(LRUCache[Tuple[Tuple[int, int], "Font"]]):
+    """A cache of loaded fonts by resolved path, bounded by number of fonts.
+    Fonts are reloaded when modification time or size of their file changes.
+
+    Args:
+        max_entries (int, optional): Maximum number of fonts. Defaults to 32.
+    """
+
+    def __init__(self, max_entries: Optional[int] = 32) -> None:
+        super().__init__(max_entries=max_entries, sizeof=lambda _: 0)
+        self.load_time = 0.0
+        """Total time spent loading fonts in seconds."""
+
+    def reset_stats(self) -> None:
+        """Reset hits, misses, evictions and load time to zero."""
+        with self._lock:
+            super().reset_stats()
+            self.load_time = 0.0
+
+    def load(
+        self, path: Path, lazy: bool, loader: Callable[[Path, bool], "Font"]
+    ) -> "Font":
+        """Get a cached font, or load and cache it if missing or outdated.
+
+        Args:
+            path (Path): Resolved path to font file.
+            lazy (bool): Passed to loader.
+            loader (Callable[[Path, bool], Font]): Load font from path.
+
+        Returns:
+            Font: Font.
+        """
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = (path, lazy)
+        with self._lock:
+            entry = self._entries.get(key) if self.enabled else None
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            self.misses += 1
+        start = perf_counter()
+        font = loader(path, lazy)
+        with self._lock:
+            self.load_time += perf_counter() - start
+        self.put(key, (signature, font))
+        return font
+
+
+def sizeof_segments(segments: Iterable["Segment"]) -> int:
+    """Estimate memory of segments in bytes. Styles are shared and not counted.
+
+    Args:
+        segments (Iterable[Segment]): Segments.
+
+    Returns:
+        int: Estimated memory in bytes.
+    """
+    return sum(sys.getsizeof(d) + sys.getsizeof(d.text) for d in segments)
+
+
+render_cache: LRUCache = LRUCache(max_memory=16 * 1024 * 1024, sizeof=sizeof_segments)
+"""Cache of rendered Typography output, shared by all instances."""
+
+shape_cache: LRUCache = LRUCache(max_entries=8192)
+"""Cache of shaped runs of text, shared by all instances."""
+
+font_cache: FontCache = FontCache()
+"""Cache of fonts loaded from files, shared by all instances."""
@@ -0,0 +1,28 @@
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import cast
+
+from rich_typography.compiled import SUFFIX
+from rich_typography.font import Font
+from rich_typography.registry import builtin_fonts, find_font
+
+
+def main() -> None:
+    """Compile .toff font files to .tofc files next to them."""
+    parser = ArgumentParser(
+        prog="python -m rich_typography.compile_fonts",
+        description="Compile .toff font files. Defaults to the builtin fonts.",
+    )
+    parser.add_argument("paths", nargs="*", type=Path, help="Paths to .toff files.")
+    args = parser.parse_args()
+    paths = args.paths or [
+        cast(Path, find_font(d)).with_suffix(".toff") for d in builtin_fonts()
+    ]
+    for source in paths:
+        target = source.with_suffix(SUFFIX)
+        Font.from_file(source).save(target)
+        print(f"Compiled {target}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
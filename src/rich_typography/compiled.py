@@ -0,0 +1,108 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+MAGIC = b"TOFC"
+"""Magic bytes at the start of compiled font files."""
+
+VERSION = 2
+"""Version of the compiled font format."""
+
+SUFFIX = ".tofc"
+"""File suffix of compiled font files."""
+
+_PREFIX = struct.Struct("<4sHI")
+_ALIGNMENT = 8
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def write_compiled(
+    path: Union[Path, str], header: Dict[str, Any], arrays: Dict[str, array]
+) -> None:
+    """Write a compiled font file.
+    The file starts with magic bytes, format version and the length of a JSON header,
+    followed by the header and the little-endian data of every array, aligned to 8 bytes.
+
+    Args:
+        path (Union[Path, str]): Path to .tofc file.
+        header (Dict[str, Any]): JSON serializable metadata.
+        arrays (Dict[str, array]): Arrays of integers.
+    """
+    layout = [
+        [name, data.typecode, data.itemsize, len(data)] for name, data in arrays.items()
+    ]
+    blob = json.dumps(
+        header | {"arrays": layout}, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    with open(path, "wb") as file:
+        file.write(_PREFIX.pack(MAGIC, VERSION, len(blob)))
+        file.write(blob)
+        offset = _PREFIX.size + len(blob)
+        for data in arrays.values():
+            file.write(bytes(_aligned(offset) - offset))
+            if sys.byteorder != "little":  # pragma: no cover
+                data = array(data.typecode, data)
+                data.byteswap()
+            file.write(data.tobytes())
+            offset = _aligned(offset) + len(data) * data.itemsize
+
+
+def read_compiled(
+    path: Union[Path, str],
+) -> Tuple[Dict[str, Any], Dict[str, Sequence[int]], Optional[mmap.mmap]]:
+    """Read a compiled font file.
+    The file is memory-mapped, so processes loading the same font share its pages.
+    The arrays are views of the mapping, which stays open while any of them is referenced.
+    To close it early, release all views before closing the mapping.
+
+    Args:
+        path (Union[Path, str]): Path to .tofc file.
+
+    Raises:
+        ValueError: File is not a compiled font.
+        ValueError: Unsupported format version.
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, Sequence[int]], Optional[mmap.mmap]]: Metadata, read-only arrays
+            and the mapping, or None if the file could not be mapped.
+    """
+    mapping: Optional[mmap.mmap]
+    with open(path, "rb") as file:
+        try:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            data = memoryview(mapping)
+        except (OSError, ValueError):
+            mapping = None
+            data = memoryview(file.read())
+    if len(data) < _PREFIX.size:
+        raise ValueError("Invalid compiled font file.")
+    magic, version, length = _PREFIX.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Invalid compiled font file.")
+    if version != VERSION:
+        raise ValueError("Unsupported compiled font version.")
+    offset = _PREFIX.size + length
+    header = json.loads(bytes(data[_PREFIX.size : offset]).decode("utf-8"))
+    arrays: Dict[str, Sequence[int]] = {}
+    for name, typecode, itemsize, count in header.pop("arrays"):
+        if array(typecode).itemsize != itemsize:  # pragma: no cover
+            raise ValueError("Unsupported compiled font file.")
+        offset = _aligned(offset)
+        view = data[offset : offset + count * itemsize]
+        if len(view) != count * itemsize:
+            raise ValueError("Invalid compiled font file.")
+        if sys.byteorder == "little":
+            arrays[name] = view.cast(typecode)
+        else:  # pragma: no cover
+            swapped = array(typecode, view.tobytes())
+            swapped.byteswap()
+            arrays[name] = swapped
+        offset += count * itemsize
+    return header, arrays, mapping
@@ -0,0 +1,45 @@
+from collections import Counter
+from typing import Dict, Union
+
+counters: "Counter[str]" = Counter()
+"""Counters of font work, like glyph lookups, placeholder fallbacks, kerning computations and ligature matches.
+Increments are not synchronized, so counts are approximate while rendering in several threads."""
+
+
+def stats() -> Dict[str, Union[int, float]]:
+    """Get counters and statistics of all shared caches.
+
+    Returns:
+        Dict[str, Union[int, float]]: Values by name. Cache statistics are prefixed with the cache name, like "render_cache.hits".
+    """
+    from rich_typography.cache import font_cache, render_cache, shape_cache
+
+    result: Dict[str, Union[int, float]] = {
+        "glyph_lookups": 0,
+        "placeholder_fallbacks": 0,
+        "kerning_computations": 0,
+        "ligature_matches": 0,
+        "section_loads": 0,
+    }
+    result.update(counters)
+    for name, cache in [
+        ("render_cache", render_cache),
+        ("shape_cache", shape_cache),
+        ("font_cache", font_cache),
+    ]:
+        result[f"{name}.entries"] = len(cache)
+        result[f"{name}.memory"] = cache.memory
+        result[f"{name}.hits"] = cache.hits
+        result[f"{name}.misses"] = cache.misses
+        result[f"{name}.evictions"] = cache.evictions
+    result["font_cache.load_time"] = font_cache.load_time
+    return result
+
+
+def reset_stats() -> None:
+    """Reset all counters and cache statistics to zero. Cached values are kept."""
+    from rich_typography.cache import font_cache, render_cache, shape_cache
+
+    counters.clear()
+    for cache in [render_cache, shape_cache, font_cache]:
+        cache.reset_stats()
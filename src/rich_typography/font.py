@@ -1,13 +1,31 @@
-from functools import lru_cache
-from glob import glob
+from array import array
+from bisect import bisect_left, bisect_right
+from mmap import mmap
 from pathlib import Path
 import string
-from typing import Any, Dict, Iterable, List, Optional, Union, cast
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from rich_typography.cache import font_cache
+from rich_typography.counters import counters
+from rich_typography.compiled import SUFFIX, read_compiled, write_compiled
+from rich_typography.glyph import Glyph, GlyphAtlas, GlyphBuffer, Glyphs
+from rich_typography.line import LineStyle, LineType
+from rich_typography.registry import find_font, get_font_names
 
-from configparser import ConfigParser
 
-from rich_typography.glyph import Glyph, Glyphs
-from rich_typography.line import LineStyle, LineType
+KerningPairs = Tuple[Sequence[int], Sequence[int], Sequence[int]]
+"""Left glyph ids, right glyph ids and overlaps of kerned glyph pairs, sorted by pair."""
 
 
 class Font:
@@ -40,25 +58,85 @@ class Font:
         overline: Optional[Union[int, LineStyle]] = None,
         strike: Optional[Union[int, LineStyle]] = None,
     ):
+        line_height = len(list(glyphs.values())[0])
+        space = Glyphs.from_lines(" ", *self.space(space_width, line_height))
+        atlas = GlyphAtlas(line_height)
+        for char, glyph in (glyphs | space).items():
+            if len(char) == 1:
+                atlas.add(glyph, char)
+        _ligatures = ligatures or {}
+        _ligature_names = [d for d in _ligatures if len(d) != 1]
+        for ligature in _ligature_names:
+            atlas.add(_ligatures[ligature], ligature)
+        placeholder = atlas.add(self.placeholder(line_height))
+        baseline = baseline or line_height - 2
+        self._setup(
+            name,
+            atlas,
+            _ligature_names,
+            placeholder,
+            letter_spacing=letter_spacing,
+            space_width=space_width,
+            baseline=baseline,
+            underline=LineStyle(baseline, "underline") | underline,
+            underline2=LineStyle(baseline + 1, "underline2") | underline2,
+            overline=LineStyle(0, "overline") | overline,
+            strike=LineStyle(line_height // 2, "strike") | strike,
+        )
+
+    def _setup(
+        self,
+        name: str,
+        atlas: GlyphAtlas,
+        ligatures: List[str],
+        placeholder: int,
+        *,
+        letter_spacing: int,
+        space_width: int,
+        baseline: int,
+        underline: LineStyle,
+        underline2: LineStyle,
+        overline: LineStyle,
+        strike: LineStyle,
+        kerning: Optional[KerningPairs] = None,
+        kerning_size: int = 0,
+    ) -> None:
         self._name = name
-        self._line_height = len(list(glyphs.values())[0])
-        space = Glyphs.from_lines(" ", *self.space(space_width, self.line_height))
-        self._glyphs = glyphs | space
-        self._ligatures = ligatures or {}
+        self._line_height = atlas.line_height
+        self._atlas = atlas
+        self._ligatures = ligatures
+        self._ligature_trie = self._build_ligature_trie(self._ligatures)
         self._letter_spacing = letter_spacing
         self._space_width = space_width
-        self._baseline = baseline or self.line_height - 2
-        self._underline = LineStyle(self._baseline, "underline") | underline
-        self._underline2 = LineStyle(self._baseline + 1, "underline2") | underline2
-        self._overline = LineStyle(0, "overline") | overline
-        self._strike = LineStyle(self.line_height // 2, "strike") | strike
-        self._placeholder = self.placeholder(self.line_height)
+        self._baseline = baseline
+        self._underline = underline
+        self._underline2 = underline2
+        self._overline = overline
+        self._strike = strike
+        self._placeholder = placeholder
+        self._kerning: Dict[Tuple[str, str], int] = {}
+        # Precomputed overlaps of the first glyphs by id, as left ids, right ids and
+        # overlaps sorted by pair. Pairs without overlap are left out.
+        self._kerning_pairs: KerningPairs = kerning or ((), (), ())
+        self._kerning_size = kerning_size
+        # Sections of lazily loaded fonts by id, and the section of every pending glyph
+        self._sections: Dict[int, Tuple[List[str], str]] = {}
+        self._pending: Dict[str, int] = {}
+        self._section_lock = Lock()
+        self._path: Optional[Path] = None
+        # Memory-mapped file of compiled fonts, which the atlas and kerning arrays view
+        self._mapping: Optional[mmap] = None
 
     @property
     def name(self) -> str:
         """Name of the Font."""
         return self._name
 
+    @property
+    def path(self) -> Optional[Path]:
+        """Resolved path of the file the Font was loaded from, or None if created in memory."""
+        return self._path
+
     @property
     def line_height(self) -> int:
         """Number of lines per glyph."""
@@ -102,7 +180,7 @@ class Font:
     @property
     def ligatures(self) -> Iterable[str]:
         """All available ligatures."""
-        return list(self._ligatures.keys())
+        return list(self._ligatures)
 
     @classmethod
     def space(cls, width: int, line_height: int) -> Glyph:
@@ -127,59 +205,73 @@ class Font:
         Returns:
             Glyph: Placeholder glyph.
         """
-        return ["┌─┐"] + ["│ │"] * (line_height - 2) + ["└─┘"]
+        return (["┌─┐"] + ["│ │"] * (line_height - 2) + ["└─┘"])[:line_height]
 
     @classmethod
-    @lru_cache
-    def _builtin_fonts(cls) -> Dict[str, Union[Path, str]]:
-        fonts = {}
-        parent_folder = Path(__file__).resolve().parent / "fonts"
-        fonts |= {
-            Path(d).stem: parent_folder / d for d in glob(str(parent_folder / "*.toff"))
-        }
-        parent_folder = Path(__file__).resolve().parent / "fonts/extended"
-        fonts |= {
-            f"extended.{Path(d).stem}": parent_folder / d
-            for d in glob(str(parent_folder / "*.toff"))
-        }
-        return fonts
+    def _build_ligature_trie(cls, ligatures: Iterable[str]) -> Dict[str, Any]:
+        trie: Dict[str, Any] = {}
+        for ligature in ligatures:
+            node = trie
+            for char in ligature:
+                node = node.setdefault(char, {})
+            # An empty key marks the end of a ligature
+            node[""] = {}
+        return trie
 
     @classmethod
     def get_font_names(cls) -> List[str]:
-        """Return list of builtin font names. Extended fonts are prefixed with 'extended.'."""
-        return list(cls._builtin_fonts().keys())
+        """Return list of builtin font names and fonts registered by other packages. Extended fonts are prefixed with 'extended.'."""
+        return get_font_names()
 
     @classmethod
-    @lru_cache
-    def from_file(cls, path: Union[Path, str]) -> "Font":
-        """Load from glyphs file.
+    def from_file(cls, path: Union[Path, str], lazy: bool = False) -> "Font":
+        """Load from glyphs file or compiled font file.
+        Fonts are cached in `font_cache` by resolved path and reloaded when the file changes.
 
         Args:
-            path (Union[Path, str]): Path to .toff file.
+            path (Union[Path, str]): Path to .toff or .tofc file, or name of registered font.
+            lazy (bool, optional): Decode sections of a .toff file only once one of their glyphs is used. Ignored for .tofc files, which need no decoding. Defaults to False.
 
         Returns:
             Font: Loaded font.
         """
+        if isinstance(path, str):
+            path = find_font(path) or path
+        path = Path(path).resolve()
+        if not path.exists():
+            raise FileNotFoundError("Font file not found.")
+        return font_cache.load(path, lazy, cls._load_file)
 
-        def split(text: str):
-            lines = [line[2:] for line in text.splitlines() if line]
-            length = max(len(line) for line in lines)
-            return [line.ljust(length) for line in lines]
+    @classmethod
+    def preload(cls, *paths: Union[Path, str], lazy: bool = False) -> None:
+        """Load fonts into `font_cache` ahead of use.
+
+        Args:
+            *paths (Union[Path, str]): Paths to .toff or .tofc files, or names of registered fonts.
+            lazy (bool, optional): Decode sections of .toff files only once one of their glyphs is used. Ignored for .tofc files. Defaults to False.
+        """
+        for path in paths:
+            cls.from_file(path, lazy)
+
+    @classmethod
+    def _load_file(cls, path: Path, lazy: bool) -> "Font":
+        font = cls._parse_file(path, lazy)
+        font._path = path
+        return font
+
+    @classmethod
+    def _parse_file(cls, path: Path, lazy: bool) -> "Font":
+        if path.suffix == SUFFIX:
+            return cls._from_compiled(path)
+        from configparser import ConfigParser
 
-        builtin_fonts = cls._builtin_fonts()
-        if isinstance(path, str) and path in builtin_fonts:
-            path = builtin_fonts[path]
-        else:
-            path = Path(path)
-        if not Path(path).exists():
-            raise FileNotFoundError("Font file not found.")
         config = ConfigParser()
         config.read(path, encoding="utf-8")
         if "header" not in config:
             raise KeyError("Font file header missing.")
         header = {}
-        glyphs = Glyphs()
-        ligatures = Glyphs()
+        sections: List[Tuple[List[str], str]] = []
+        ligatures: Tuple[List[str], str] = ([], "")
         for section, data in config.items():
             if section == "header":
                 header |= {k: (d if k in ["name"] else int(d)) for k, d in data.items()}
@@ -192,21 +284,192 @@ class Font:
                 else:
                     header[section] = int(data["index"])
             elif section == "ligatures":
-                ligatures |= Glyphs.from_lines(
-                    data["sequences"].split(),
-                    *split(data["glyphs"]),
-                )
+                ligatures = (data["sequences"].split(), data["glyphs"])
             elif section in dir(string):
-                glyphs |= Glyphs.from_lines(
-                    getattr(string, section),
-                    *split(data["glyphs"]),
-                )
+                sections.append((list(getattr(string, section)), data["glyphs"]))
             elif "chars" in data:
-                glyphs |= Glyphs.from_lines(
-                    list(data["chars"].replace(" ", "")),
-                    *split(data["glyphs"]),
-                )
-        return Font(**header, glyphs=glyphs, ligatures=ligatures)
+                sections.append((list(data["chars"].replace(" ", "")), data["glyphs"]))
+        if not sections:
+            raise ValueError(f"Font file {path} has no glyph sections.")
+        if lazy:
+            return cls._from_sections(header, sections, ligatures)
+        glyphs = Glyphs()
+        for chars, encoded in sections:
+            glyphs |= cls._decode_section(chars, encoded)
+        return Font(**header, glyphs=glyphs, ligatures=cls._decode_section(*ligatures))
+
+    @classmethod
+    def _split_section(cls, text: str) -> List[str]:
+        lines = [line[2:] for line in text.splitlines() if line]
+        length = max(len(line) for line in lines)
+        return [line.ljust(length) for line in lines]
+
+    @classmethod
+    def _decode_section(cls, chars: List[str], text: str) -> Glyphs:
+        if not chars:
+            return Glyphs()
+        return Glyphs.from_lines(chars, *cls._split_section(text))
+
+    @classmethod
+    def _from_sections(
+        cls,
+        header: Dict[str, Any],
+        sections: List[Tuple[List[str], str]],
+        ligatures: Tuple[List[str], str],
+    ) -> "Font":
+        line_height = len(cls._split_section(sections[0][1]))
+        # The space glyph is always replaced by one of space_width,
+        # so this only sets the line height.
+        font = Font(**header, glyphs={" ": cls.space(0, line_height)})
+        font._ligatures = [d for d in ligatures[0] if len(d) != 1]
+        font._ligature_trie = cls._build_ligature_trie(font._ligatures)
+        for section_id, (chars, _) in enumerate(sections):
+            font._pending |= {d: section_id for d in chars if d != " "}
+        font._pending |= {d: len(sections) for d in font._ligatures}
+        font._sections = dict(enumerate(sections + [ligatures]))
+        return font
+
+    @classmethod
+    def _from_compiled(cls, path: Union[Path, str]) -> "Font":
+        header, arrays, mapping = read_compiled(path)
+        font = cls.__new__(cls)
+        font._setup(
+            header["name"],
+            GlyphAtlas.from_arrays(header["line_height"], header["index"], arrays),
+            header["ligatures"],
+            header["placeholder"],
+            letter_spacing=header["letter_spacing"],
+            space_width=header["space_width"],
+            baseline=header["baseline"],
+            kerning=(
+                arrays["kerning_left"],
+                arrays["kerning_right"],
+                arrays["kerning_overlap"],
+            ),
+            kerning_size=header["kerning_size"],
+            **{
+                line: LineStyle(*header[line])
+                for line in ["underline", "underline2", "overline", "strike"]
+            },
+        )
+        font._mapping = mapping
+        return font
+
+    def close(self) -> None:
+        """Unmap the file of a font loaded from a compiled font file.
+        Glyphs and kerning are copied into memory first, so the font stays usable.
+        Without closing, the file stays mapped until the font is garbage collected.
+        """
+        mapping = self._mapping
+        if mapping is None:
+            return
+        self._atlas.copy_arrays()
+        self._kerning_pairs = cast(
+            KerningPairs,
+            tuple(
+                array(d.format, d) if isinstance(d, memoryview) else d
+                for d in self._kerning_pairs
+            ),
+        )
+        self._mapping = None
+        try:
+            mapping.close()
+        except BufferError:  # pragma: no cover
+            # Views still referenced elsewhere keep the mapping open until released
+            pass
+
+    def clear_memos(self) -> None:
+        """Forget kerning pairs and decoded glyphs, which are memoised on first use."""
+        self._kerning.clear()
+        self._atlas.clear_decoded()
+
+    def save(self, path: Union[Path, str]) -> None:
+        """Save in compiled font format, which loads without parsing glyphs.
+        The file holds glyphs, metrics, line styles, ligatures and the kerning of all glyph pairs.
+        Only pairs that overlap are stored, so kerning grows with the number of kerned pairs.
+
+        Args:
+            path (Union[Path, str]): Path to .tofc file.
+        """
+        self._load_sections()
+        size = len(self._atlas._widths)
+        pairs = []
+        for left in range(size):
+            for right in range(size):
+                overlap = self._atlas.max_overlap(left, right)
+                if overlap:
+                    pairs.append((left, right, overlap))
+        kerning = self._kerning_arrays(pairs, size)
+        header = {
+            "name": self._name,
+            "line_height": self._line_height,
+            "letter_spacing": self._letter_spacing,
+            "space_width": self._space_width,
+            "baseline": self._baseline,
+            "index": self._atlas.index,
+            "ligatures": self._ligatures,
+            "placeholder": self._placeholder,
+            "kerning_size": size,
+        } | {
+            name: [line.index, line.line, line.char]
+            for name, line in [
+                ("underline", self._underline),
+                ("underline2", self._underline2),
+                ("overline", self._overline),
+                ("strike", self._strike),
+            ]
+        }
+        write_compiled(
+            path,
+            header,
+            self._atlas.arrays()
+            | dict(zip(["kerning_left", "kerning_right", "kerning_overlap"], kerning)),
+        )
+
+    def subset(self, chars: Iterable[str]) -> "Font":
+        """Create a font with only the glyphs needed to render a set of chars.
+        Ligatures are kept if all of their chars are in the set, and precomputed kerning is trimmed to the kept glyphs.
+        Save the subset to get a compiled font file of it.
+
+        Args:
+            chars (Iterable[str]): Chars or sample texts.
+
+        Returns:
+            Font: Font with glyphs of chars and matching ligatures.
+        """
+        available = set("".join(chars)) | {" "}
+        keys = [d for d in sorted(available) if d in self]
+        ligatures = [d for d in self._ligatures if set(d) <= available]
+        atlas = GlyphAtlas(self._line_height)
+        ids = [self._glyph_id(d) for d in keys + ligatures] + [self._placeholder]
+        for key, glyph_id in zip(keys + ligatures, ids):
+            atlas.add(self._atlas.glyph(glyph_id), key)
+        placeholder = atlas.add(self._atlas.glyph(self._placeholder))
+        pairs = []
+        precomputed = all(d < self._kerning_size for d in ids)
+        if precomputed:
+            for left, left_id in enumerate(ids):
+                for right, right_id in enumerate(ids):
+                    overlap = self._precomputed_kerning(left_id, right_id)
+                    if overlap:
+                        pairs.append((left, right, overlap))
+        font = Font.__new__(Font)
+        font._setup(
+            self._name,
+            atlas,
+            ligatures,
+            placeholder,
+            letter_spacing=self._letter_spacing,
+            space_width=self._space_width,
+            baseline=self._baseline,
+            underline=self._underline,
+            underline2=self._underline2,
+            overline=self._overline,
+            strike=self._strike,
+            kerning=self._kerning_arrays(pairs, len(ids)),
+            kerning_size=len(ids) if precomputed else 0,
+        )
+        return font
 
     def get(self, char: str) -> Glyph:
         """Get glyph for char or ligature.
@@ -217,24 +480,151 @@ class Font:
         Returns:
             Glyph: Glyph for char.
         """
-        if len(char) == 1:
-            glyph = self._glyphs.get(char, self._placeholder)
-        else:
-            glyph = self._ligatures.get(char, self._placeholder)
-        return glyph
+        return self._atlas.glyph(self._glyph_id(char))
+
+    def get_buffer(self, char: str) -> GlyphBuffer:
+        """Get glyph for char or ligature as GlyphBuffer.
+
+        Args:
+            char (str): Char or group of chars (ligature).
+
+        Returns:
+            GlyphBuffer: Buffer holding the glyph for char.
+        """
+        return self._atlas.buffer(self._glyph_id(char))
+
+    def glyph_width(self, char: str) -> int:
+        """Get width of glyph for char or ligature.
+
+        Args:
+            char (str): Char or group of chars (ligature).
+
+        Returns:
+            int: Width in number of cells.
+        """
+        return self._atlas.width(self._glyph_id(char))
+
+    def glyph_borders(self, text: str) -> List[int]:
+        """Get the offsets at which glyphs start in text.
+        At every position the longest matching ligature is used.
+
+        Args:
+            text (str): Text.
+
+        Returns:
+            List[int]: Start offset of every glyph.
+        """
+        borders = []
+        pos = 0
+        while pos < len(text):
+            borders.append(pos)
+            pos = self.match_glyph(text, pos)
+        return borders
+
+    def match_glyph(self, text: str, pos: int = 0) -> int:
+        """Get the end offset of the glyph starting at a position in text.
+        The longest matching ligature is used, otherwise the single char.
+
+        Args:
+            text (str): Text.
+            pos (int, optional): Start offset of glyph. Defaults to 0.
+
+        Returns:
+            int: End offset of glyph.
+        """
+        node = self._ligature_trie
+        end = pos + 1
+        for idx in range(pos, len(text)):
+            child = node.get(text[idx])
+            if child is None:
+                break
+            node = child
+            if "" in node:
+                end = idx + 1
+        if end - pos > 1:
+            counters["ligature_matches"] += 1
+        return end
+
+    def kerning(self, left: str, right: str) -> int:
+        """Get the maximum number of cells two glyphs can overlap without occluding each other.
+        Overlaps are calculated on first use and cached per pair.
+
+        Args:
+            left (str): Left char or ligature.
+            right (str): Right char or ligature.
+
+        Returns:
+            int: Max overlap in number of cells.
+        """
+        pair = (left, right)
+        overlap = self._kerning.get(pair)
+        if overlap is None:
+            left_id, right_id = self._glyph_id(left), self._glyph_id(right)
+            size = self._kerning_size
+            if left_id < size and right_id < size:
+                overlap = self._precomputed_kerning(left_id, right_id)
+            else:
+                counters["kerning_computations"] += 1
+                overlap = self._atlas.max_overlap(left_id, right_id)
+            self._kerning[pair] = overlap
+        return overlap
+
+    def _precomputed_kerning(self, left_id: int, right_id: int) -> int:
+        lefts, rights, overlaps = self._kerning_pairs
+        start = bisect_left(lefts, left_id)
+        end = bisect_right(lefts, left_id, start)
+        idx = bisect_left(rights, right_id, start, end)
+        return overlaps[idx] if idx < end and rights[idx] == right_id else 0
+
+    @classmethod
+    def _kerning_arrays(
+        cls, pairs: List[Tuple[int, int, int]], size: int
+    ) -> Tuple[array, array, array]:
+        ids = "H" if size <= 1 << 16 else "I"
+        overlaps = "B" if max((d[2] for d in pairs), default=0) < 256 else "I"
+        return (
+            array(ids, [d[0] for d in pairs]),
+            array(ids, [d[1] for d in pairs]),
+            array(overlaps, [d[2] for d in pairs]),
+        )
+
+    def _glyph_id(self, char: str) -> int:
+        counters["glyph_lookups"] += 1
+        glyph_id = self._atlas.get_id(char)
+        section_id = None if glyph_id is not None else self._pending.get(char)
+        if section_id is not None:
+            self._load_section(section_id)
+            glyph_id = self._atlas.get_id(char)
+        if glyph_id is None:
+            counters["placeholder_fallbacks"] += 1
+            return self._placeholder
+        return glyph_id
+
+    def _load_section(self, section_id: int) -> None:
+        with self._section_lock:
+            section = self._sections.pop(section_id, None)
+            if section is None:
+                return
+            counters["section_loads"] += 1
+            for char, glyph in self._decode_section(*section).items():
+                if self._pending.get(char) == section_id:
+                    self._atlas.add(glyph, char)
+                    del self._pending[char]
+
+    def _load_sections(self) -> None:
+        for section_id in list(self._sections):
+            self._load_section(section_id)
 
     def __contains__(self, other: Any) -> bool:
         if isinstance(other, str):
-            return (
-                other in self._glyphs if len(other) == 1 else other in self._ligatures
-            )
+            return other in self._atlas or other in self._pending
         else:
             raise ValueError
 
     def __str__(self):
+        self._load_sections()
         return "\n".join(
-            char + "\n" + "\n".join(glyph)
-            for char, glyph in (self._glyphs | self._ligatures).items()
+            char + "\n" + "\n".join(self.get(char)) for char in self._atlas
         )
 
     def __repr__(self):
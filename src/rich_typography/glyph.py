@@ -1,5 +1,6 @@
+from array import array
 from itertools import zip_longest
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Sequence, Union
 
 Glyph = List[str]
 """A single glyph represented by lines of text."""
@@ -203,3 +204,416 @@ class Glyphs(dict):
             else:
                 offsets = [-(d + 1)] * line_height
         return offsets
+
+
+class GlyphBuffer:
+    """A mutable glyph, that grows to the right by merging glyphs into its tail.
+    Every line is held as a list of text chunks, which are only joined once the buffer
+    is read. Leading and trailing whitespace of every line is tracked, so kerning and
+    merging only ever touch the cells at the tail.
+
+    Args:
+        line_height (int): Number of lines.
+        indent (int, optional): Width of leading whitespace in number of cells. Defaults to 0.
+    """
+
+    def __init__(self, line_height: int, indent: int = 0) -> None:
+        indent = max(indent, 0)
+        self._chunks: List[List[str]] = [
+            [" " * indent] if indent else [] for _ in range(line_height)
+        ]
+        self._width = indent
+        self._lead = [indent] * line_height
+        self._trail = [indent] * line_height
+
+    @classmethod
+    def from_glyph(
+        cls,
+        glyph: Glyph,
+        lead: Optional[Sequence[int]] = None,
+        trail: Optional[Sequence[int]] = None,
+    ) -> "GlyphBuffer":
+        """Create a GlyphBuffer from a glyph.
+
+        Args:
+            glyph (List[str]): Glyph.
+            lead (Sequence[int], optional): Precomputed leading whitespace per line. Defaults to None.
+            trail (Sequence[int], optional): Precomputed trailing whitespace per line. Defaults to None.
+
+        Returns:
+            GlyphBuffer: Buffer holding the glyph.
+        """
+        buffer = cls(0)
+        buffer._chunks = [[line] for line in glyph]
+        buffer._width = len(glyph[0]) if glyph else 0
+        if lead is None:
+            lead = [Glyphs.line_lead(line) for line in glyph]
+        if trail is None:
+            trail = [Glyphs.line_trail(line) for line in glyph]
+        buffer._lead = list(lead)
+        buffer._trail = list(trail)
+        return buffer
+
+    @property
+    def width(self) -> int:
+        """Width in number of cells."""
+        return self._width
+
+    @property
+    def lines(self) -> Glyph:
+        """Content as lines of text."""
+        return ["".join(chunks) for chunks in self._chunks]
+
+    @property
+    def lead(self) -> Sequence[int]:
+        """Leading whitespace of every line."""
+        return self._lead
+
+    @property
+    def trail(self) -> Sequence[int]:
+        """Trailing whitespace of every line."""
+        return self._trail
+
+    def copy(self) -> "GlyphBuffer":
+        """Return a copy of this buffer."""
+        buffer = type(self)(0)
+        buffer._chunks = [chunks[:] for chunks in self._chunks]
+        buffer._width = self._width
+        buffer._lead = self._lead[:]
+        buffer._trail = self._trail[:]
+        return buffer
+
+    def max_overlap(self, other: "GlyphBuffer") -> int:
+        """Calculates the maximum number of cells another buffer can overlap the tail without occluding it.
+
+        Args:
+            other (GlyphBuffer): Right buffer.
+
+        Returns:
+            int: Max overlap in number of cells.
+        """
+        return min(trail + lead for trail, lead in zip(self._trail, other._lead))
+
+    def boundary(self, other: "GlyphBuffer", spacing: int) -> List[int]:
+        """Calculates the boundary between the tail and another buffer. See `Glyphs.boundary`.
+
+        Args:
+            other (GlyphBuffer): Right buffer.
+            spacing (int): Space between both buffers in number of cells.
+
+        Returns:
+            List[int]: Boundary in offsets from the end of this buffer.
+        """
+        return [
+            min(min(0, spacing + lead), max(spacing, -trail))
+            for trail, lead in zip(self._trail, other._lead)
+        ]
+
+    def bg_boundary(self, other: "GlyphBuffer", spacing: int) -> List[int]:
+        """Calculates the background boundary between the tail and another buffer. See `Glyphs.bg_boundary`.
+
+        Args:
+            other (GlyphBuffer): Right buffer.
+            spacing (int): Space between both buffers in number of cells.
+
+        Returns:
+            List[int]: Boundary in offsets from the end of this buffer.
+        """
+        if not spacing:
+            return [0] * len(self._chunks)
+        cells = abs(spacing)
+        return Glyphs.bg_boundary(
+            [self._tail(chunks, cells) for chunks in self._chunks],
+            ["".join(chunks)[:cells] for chunks in other._chunks],
+            spacing,
+        )
+
+    def merge(self, other: "GlyphBuffer", spacing: int = 0) -> None:
+        """Merges another buffer into the tail. In case of overlapping non-space characters, the other buffer will occlude this one.
+
+        Args:
+            other (GlyphBuffer): Right buffer.
+            spacing (int): Space between both buffers in number of cells. Defaults to 0.
+        """
+        width = self._width
+        other_width = other._width
+        if spacing >= 0:
+            padding = " " * spacing
+            for chunks, right in zip(self._chunks, other._chunks):
+                if padding:
+                    chunks.append(padding)
+                chunks.extend(right)
+        else:
+            for chunks, right in zip(self._chunks, other._chunks):
+                # Only the chunks covered by the overlap are merged cell by cell
+                tail = self._tail(chunks, -spacing, pop=True)
+                chunks.append(Glyphs.merge_line(tail, "".join(right), spacing))
+        offset = width + spacing
+        merged_width = offset + other_width
+        if -spacing > min(width, other_width):
+            # Overlaps beyond the width of either buffer cut off cells
+            for row, chunks in enumerate(self._chunks):
+                line = "".join(chunks)
+                self._chunks[row] = [line]
+                self._lead[row] = Glyphs.line_lead(line)
+                self._trail[row] = Glyphs.line_trail(line)
+            self._width = len(self._chunks[0][0]) if self._chunks else 0
+            return
+        leads, trails = self._lead, self._trail
+        for row, (other_lead, other_trail) in enumerate(zip(other._lead, other._trail)):
+            blank = leads[row] >= width
+            if other_lead < other_width:
+                if blank:
+                    leads[row] = offset + other_lead
+                    trails[row] = other_trail
+                else:
+                    leads[row] = min(leads[row], offset + other_lead)
+                    trails[row] = min(trails[row] + spacing + other_width, other_trail)
+            elif blank:
+                leads[row] = trails[row] = merged_width
+            else:
+                trails[row] += spacing + other_width
+        self._width = merged_width
+
+    @classmethod
+    def _tail(cls, chunks: List[str], cells: int, pop: bool = False) -> str:
+        """Get the text of the last chunks of a line, covering at least a number of cells.
+
+        Args:
+            chunks (List[str]): Chunks of a line.
+            cells (int): Number of cells to cover.
+            pop (bool, optional): Remove the covering chunks from the line. Defaults to False.
+
+        Returns:
+            str: Text of the covering chunks, or the whole line if it is shorter.
+        """
+        count = 0
+        length = 0
+        while count < len(chunks) and length < cells:
+            count += 1
+            length += len(chunks[-count])
+        tail = "".join(chunks[len(chunks) - count :])
+        if pop:
+            del chunks[len(chunks) - count :]
+        return tail
+
+
+class GlyphAtlas:
+    """Compact storage for glyphs of equal line height.
+    The cells of all glyphs are stored as codepoints in a single array, alongside
+    the width and the leading and trailing whitespace of every line of a glyph.
+
+    Args:
+        line_height (int): Number of lines per glyph.
+    """
+
+    def __init__(self, line_height: int) -> None:
+        self._line_height = line_height
+        self._index: Dict[str, int] = {}
+        self._cells = array("I")
+        self._offsets = array("I")
+        self._widths = array("I")
+        self._leads = array("I")
+        self._trails = array("I")
+        # Glyphs decoded from the cells, by id. Ids never change once added.
+        self._buffers: Dict[int, GlyphBuffer] = {}
+
+    @property
+    def line_height(self) -> int:
+        """Number of lines per glyph."""
+        return self._line_height
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        line_height: int,
+        index: Dict[str, int],
+        arrays: Dict[str, Sequence[int]],
+    ) -> "GlyphAtlas":
+        """Create a GlyphAtlas from previously exported arrays.
+        Arrays are used without copying until glyphs are added.
+
+        Args:
+            line_height (int): Number of lines per glyph.
+            index (Dict[str, int]): Glyph ids by char or ligature.
+            arrays (Dict[str, Sequence[int]]): Arrays as returned by `arrays`.
+
+        Returns:
+            GlyphAtlas: Atlas using the arrays.
+        """
+        atlas = cls(line_height)
+        atlas._index = dict(index)
+        atlas._cells = arrays["cells"]  # type: ignore[assignment]
+        atlas._offsets = arrays["offsets"]  # type: ignore[assignment]
+        atlas._widths = arrays["widths"]  # type: ignore[assignment]
+        atlas._leads = arrays["leads"]  # type: ignore[assignment]
+        atlas._trails = arrays["trails"]  # type: ignore[assignment]
+        return atlas
+
+    @property
+    def index(self) -> Dict[str, int]:
+        """Glyph ids by char or ligature."""
+        return dict(self._index)
+
+    def arrays(self) -> Dict[str, array]:
+        """Export the arrays holding cells and metrics of all glyphs.
+
+        Returns:
+            Dict[str, array]: Arrays by name.
+        """
+        return {
+            "cells": array("I", self._cells),
+            "offsets": array("I", self._offsets),
+            "widths": array("I", self._widths),
+            "leads": array("I", self._leads),
+            "trails": array("I", self._trails),
+        }
+
+    def copy_arrays(self) -> None:
+        """Copy arrays used from read-only buffers into memory, so the buffers can be released."""
+        if not isinstance(self._cells, array):
+            for name, data in self.arrays().items():
+                setattr(self, f"_{name}", data)
+
+    def clear_decoded(self) -> None:
+        """Forget glyphs decoded by `glyph` and `buffer`."""
+        self._buffers.clear()
+
+    def add(self, glyph: Glyph, key: Optional[str] = None) -> int:
+        """Add a glyph. Glyphs added under an existing key replace the previous glyph.
+
+        Args:
+            glyph (List[str]): Glyph.
+            key (str, optional): Char or ligature to index the glyph by. Defaults to None.
+
+        Raises:
+            ValueError: Line height of glyph does not match.
+
+        Returns:
+            int: Id of the glyph.
+        """
+        if len(glyph) != self._line_height:
+            raise ValueError("Line height missmatch.")
+        # Arrays from read-only buffers are copied on first write
+        self.copy_arrays()
+        glyph_id = len(self._widths)
+        self._offsets.append(len(self._cells))
+        self._widths.append(len(glyph[0]))
+        for line in glyph:
+            self._cells.extend(map(ord, line))
+            self._leads.append(Glyphs.line_lead(line))
+            self._trails.append(Glyphs.line_trail(line))
+        if key is not None:
+            self._index[key] = glyph_id
+        return glyph_id
+
+    def get_id(self, key: str) -> Optional[int]:
+        """Get id of the glyph for a char or ligature.
+
+        Args:
+            key (str): Char or ligature.
+
+        Returns:
+            Optional[int]: Id of the glyph, or None if not available.
+        """
+        return self._index.get(key)
+
+    def glyph(self, glyph_id: int) -> Glyph:
+        """Get glyph by id.
+
+        Args:
+            glyph_id (int): Id of the glyph.
+
+        Returns:
+            Glyph: Glyph.
+        """
+        return self._decode(glyph_id).lines
+
+    def buffer(self, glyph_id: int) -> GlyphBuffer:
+        """Create a GlyphBuffer holding a glyph.
+
+        Args:
+            glyph_id (int): Id of the glyph.
+
+        Returns:
+            GlyphBuffer: Buffer holding the glyph.
+        """
+        return self._decode(glyph_id).copy()
+
+    def width(self, glyph_id: int) -> int:
+        """Get width of glyph in number of cells.
+
+        Args:
+            glyph_id (int): Id of the glyph.
+
+        Returns:
+            int: Width in number of cells.
+        """
+        return self._widths[glyph_id]
+
+    def lead(self, glyph_id: int) -> Sequence[int]:
+        """Get leading whitespace of every line of a glyph.
+
+        Args:
+            glyph_id (int): Id of the glyph.
+
+        Returns:
+            Sequence[int]: Leading whitespace count per line.
+        """
+        start = glyph_id * self._line_height
+        return self._leads[start : start + self._line_height]
+
+    def trail(self, glyph_id: int) -> Sequence[int]:
+        """Get trailing whitespace of every line of a glyph.
+
+        Args:
+            glyph_id (int): Id of the glyph.
+
+        Returns:
+            Sequence[int]: Trailing whitespace count per line.
+        """
+        start = glyph_id * self._line_height
+        return self._trails[start : start + self._line_height]
+
+    def max_overlap(self, left_id: int, right_id: int) -> int:
+        """Calculates the maximum number of cells two glyphs can overlap without occluding each other.
+
+        Args:
+            left_id (int): Id of the left glyph.
+            right_id (int): Id of the right glyph.
+
+        Returns:
+            int: Max overlap in number of cells.
+        """
+        return min(
+            trail + lead
+            for trail, lead in zip(self.trail(left_id), self.lead(right_id))
+        )
+
+    def _decode(self, glyph_id: int) -> GlyphBuffer:
+        buffer = self._buffers.get(glyph_id)
+        if buffer is None:
+            width = self._widths[glyph_id]
+            start = self._offsets[glyph_id]
+            cells = self._cells
+            if width:
+                glyph = [
+                    "".join(map(chr, cells[pos : pos + width]))
+                    for pos in range(start, start + width * self._line_height, width)
+                ]
+            else:
+                glyph = [""] * self._line_height
+            buffer = GlyphBuffer.from_glyph(
+                glyph, self.lead(glyph_id), self.trail(glyph_id)
+            )
+            self._buffers[glyph_id] = buffer
+        return buffer
@@ -0,0 +1,151 @@
+import io
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from rich.segment import Segment
+from rich.style import Style
+
+from rich_typography.font import Font
+from rich_typography.typography import DEFAULT_JUSTIFY, DEFAULT_OVERFLOW, Typography
+
+if TYPE_CHECKING:
+    from rich.console import Console, ConsoleOptions, RenderResult
+    from rich.measure import Measurement
+
+DEFAULT_MIN_CHARS = 20000
+"""Length of text below which documents are rendered in a single process."""
+
+_Paragraph = Tuple[str, List[Tuple[int, int, Style]]]
+_Task = Tuple[Path, int, Dict[str, Any], List[_Paragraph]]
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = Lock()
+
+
+def get_executor() -> Executor:
+    """Get the process pool shared by all parallel renders, starting it on first use.
+
+    Returns:
+        Executor: Process pool with one worker per CPU.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor()
+        return _executor
+
+
+def shutdown() -> None:
+    """Stop the shared process pool. It is started again by the next parallel render."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+class ParallelTypography:
+    """Renders a Typography document in a process pool, one batch of paragraphs per task.
+    The text is split at hard line breaks, and workers load the font from its file by path,
+    so Font objects are never sent between processes. Rows are yielded in order as batches finish.
+    Documents shorter than `min_chars`, single paragraphs and fonts created in memory are rendered
+    in the calling process, through the render cache, as is everything on single CPU machines
+    unless an executor is given.
+
+    Args:
+        typography (Typography): Document to render.
+        min_chars (int, optional): Length of text below which it is rendered in a single process. Defaults to 20000.
+        executor (Executor, optional): Executor running the batches. Defaults to None, to use the shared process pool.
+    """
+
+    def __init__(
+        self,
+        typography: Typography,
+        *,
+        min_chars: int = DEFAULT_MIN_CHARS,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self.typography = typography
+        self.min_chars = min_chars
+        self.executor = executor
+
+    def __rich_console__(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> "RenderResult":
+        typography = self.typography
+        if (
+            (self.executor is None and (os.cpu_count() or 1) < 2)
+            or typography.font.path is None
+            or len(typography) < self.min_chars
+            or "\n" not in typography.plain
+        ):
+            yield from typography.__rich_console__(console, options)
+            return
+        executor = self.executor or get_executor()
+        for segments in executor.map(_render_task, self._tasks(console, options)):
+            yield from segments
+
+    def __rich_measure__(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> "Measurement":
+        return self.typography.__rich_measure__(console, options)
+
+    def _tasks(self, console: "Console", options: "ConsoleOptions") -> Iterator[_Task]:
+        typography = self.typography
+        font_path = typography.font.path
+        assert font_path is not None
+        tab_size = (
+            console.tab_size if typography.tab_size is None else typography.tab_size
+        )
+        # Styles are resolved here, since workers have no access to the theme of the console
+        settings: Dict[str, Any] = {
+            "style": console.get_style(typography.style),
+            "justify": typography.justify or options.justify or DEFAULT_JUSTIFY,
+            "overflow": typography.overflow or options.overflow or DEFAULT_OVERFLOW,
+            "no_wrap": bool(typography.no_wrap or options.no_wrap),
+            "tab_size": tab_size,
+            "adjust_spacing": typography.adjust_spacing,
+            "use_kerning": typography.use_kerning,
+            "use_ligatures": typography.use_ligatures,
+            "style_ligatures": typography.style_ligatures,
+        }
+        styles: Dict[Any, Style] = {}
+        batch: List[_Paragraph] = []
+        size = 0
+        batch_size = max(len(typography) // (4 * (os.cpu_count() or 1)), 1)
+        for line in typography.split_lines():
+            spans = []
+            for span in line.spans:
+                style = styles.get(span.style)
+                if style is None:
+                    style = console.get_style(span.style, default=Style.null())
+                    styles[span.style] = style
+                spans.append((span.start, span.end, style))
+            batch.append((line.plain, spans))
+            size += len(line.plain) + 1
+            if size >= batch_size:
+                yield font_path, options.max_width, settings, batch
+                batch = []
+                size = 0
+        if batch:
+            yield font_path, options.max_width, settings, batch
+
+
+def _render_task(task: _Task) -> List[Segment]:
+    from rich.console import Console
+    from rich.text import Span
+
+    font_path, width, settings, paragraphs = task
+    font = Font.from_file(font_path)
+    console = Console(file=io.StringIO(), width=width, color_system=None)
+    segments: List[Segment] = []
+    for plain, spans in paragraphs:
+        typography = Typography(
+            plain, spans=[Span(*d) for d in spans], font=font, **settings
+        )
+        for line_segments in typography.render_lines(console, console.options):
+            segments.extend(line_segments)
+    return segments
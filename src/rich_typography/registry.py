@@ -0,0 +1,123 @@
+import atexit
+import json
+import os
+import sys
+import warnings
+from contextlib import ExitStack
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from importlib.resources.abc import Traversable
+
+FontResource = Union["Traversable", Path, str]
+"""Location of a font file, either a package resource or a path."""
+
+MANIFEST = "manifest.json"
+"""Name of the manifest mapping builtin font names to files in the fonts folder."""
+
+ENTRY_POINT_GROUP = "rich_typography.fonts"
+"""Entry point group of font packages. Entry points provide a mapping of font names to
+font files, or a callable returning it."""
+
+_extracted = ExitStack()
+atexit.register(_extracted.close)
+_extracted_paths: Dict[str, Path] = {}
+
+
+@lru_cache
+def builtin_fonts() -> Dict[str, Union["Traversable", Path]]:
+    """Get builtin fonts listed in the manifest. Extended fonts are prefixed with 'extended.'.
+
+    Returns:
+        Dict[str, Union[Traversable, Path]]: Font files by name.
+    """
+    folder: Union["Traversable", Path] = Path(__file__).parent / "fonts"
+    if not (folder / MANIFEST).is_file():
+        # Only packages outside the file system, like zipapps, need the slow import
+        from importlib.resources import files
+
+        folder = files("rich_typography") / "fonts"
+    manifest = json.loads((folder / MANIFEST).read_text(encoding="utf-8"))
+    return {name: folder.joinpath(*file.split("/")) for name, file in manifest.items()}
+
+
+@lru_cache
+def plugin_fonts() -> Dict[str, FontResource]:
+    """Get fonts registered by other packages through entry points.
+    Fonts with the name of a builtin font are ignored.
+
+    Returns:
+        Dict[str, FontResource]: Font files by name.
+    """
+    from importlib.metadata import entry_points
+
+    if sys.version_info >= (3, 10):
+        group = entry_points(group=ENTRY_POINT_GROUP)
+    else:  # pragma: no cover
+        group = entry_points().get(ENTRY_POINT_GROUP, [])
+    fonts: Dict[str, FontResource] = {}
+    for entry_point in group:
+        # A broken font package must not break fonts of other packages
+        try:
+            provided = entry_point.load()
+            fonts |= provided() if callable(provided) else provided
+        except Exception as error:
+            warnings.warn(
+                f"Failed to load fonts of entry point {entry_point.name!r}: {error}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+    return {name: d for name, d in fonts.items() if name not in builtin_fonts()}
+
+
+def get_font_names() -> List[str]:
+    """Get names of builtin fonts and fonts registered by other packages.
+
+    Returns:
+        List[str]: Font names.
+    """
+    return list(builtin_fonts()) + list(plugin_fonts())
+
+
+def find_font(name: str) -> Optional[Path]:
+    """Get the path to the file of a registered font.
+    Fonts inside zip archives are extracted to a temporary file.
+
+    Args:
+        name (str): Font name.
+
+    Returns:
+        Optional[Path]: Path to font file, or None if no font is registered by name or name is a file path.
+    """
+    resource: Optional[FontResource] = builtin_fonts().get(name)
+    if resource is None:
+        if _is_file_path(name):
+            return None
+        resource = plugin_fonts().get(name)
+    if resource is None:
+        return None
+    return _as_path(resource)
+
+
+def _is_file_path(name: str) -> bool:
+    # Plugins are only loaded for names that cannot be local font files
+    return (
+        "/" in name
+        or os.sep in name
+        or Path(name).suffix in [".toff", ".tofc"]
+        or Path(name).exists()
+    )
+
+
+def _as_path(resource: FontResource) -> Path:
+    if isinstance(resource, (Path, str)):
+        return Path(resource)
+    # Resources are not always hashable, so extracted files are kept by their location
+    location = str(resource)
+    if location not in _extracted_paths:
+        from importlib.resources import as_file
+
+        _extracted_paths[location] = _extracted.enter_context(as_file(resource))
+    return _extracted_paths[location]
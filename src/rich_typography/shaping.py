@@ -0,0 +1,199 @@
+from itertools import groupby
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from rich_typography.cache import shape_cache
+from rich_typography.glyph import GlyphBuffer
+
+if TYPE_CHECKING:
+    from rich_typography.typography import Typography
+
+
+class ShapedRun:
+    """A run of glyphs without spaces, shaped with the settings of a Typography.
+
+    Args:
+        width (int): Rendered width in number of cells.
+    """
+
+    __slots__ = ["width", "shape"]
+
+    def __init__(self, width: int) -> None:
+        self.width = width
+        self.shape: Optional[Tuple[GlyphBuffer, bool]] = None
+        """Merged glyphs, and whether they hold after a space. None until first shaped."""
+
+
+class Shaper:
+    """Shapes text run by run, sharing shaped runs between renders through `shape_cache`.
+
+    Args:
+        typography (Typography): Typography providing font and spacing settings.
+    """
+
+    def __init__(self, typography: "Typography") -> None:
+        self._typography = typography
+        self._font = typography.font
+        self._spacing = typography.font.letter_spacing + typography.adjust_spacing
+
+    def split(self, text: str) -> List[str]:
+        """Split text into glyphs.
+
+        Args:
+            text (str): Text.
+
+        Returns:
+            List[str]: Chars and ligatures.
+        """
+        if self._typography.use_ligatures:
+            return list(self._typography.split_glyphs(text).values())
+        return list(text)
+
+    def measure(self, run: str) -> int:
+        """Get rendered width of a run of text.
+
+        Args:
+            run (str): Text.
+
+        Returns:
+            int: Rendered width in number of cells.
+        """
+        return self._run(run).width if run else 0
+
+    def width(self, text: str) -> int:
+        """Get rendered width of text, measuring runs between spaces through the cache.
+
+        Args:
+            text (str): Text.
+
+        Returns:
+            int: Rendered width in number of cells.
+        """
+        width = 0
+        count = 0
+        for is_space, group in groupby(self.split(text), key=lambda d: d == " "):
+            glyphs = list(group)
+            if is_space:
+                width += len(glyphs) * self._font.glyph_width(" ")
+                count += len(glyphs)
+            else:
+                width += self._run("".join(glyphs), glyphs).width
+                count += 1
+        return width + (count - 1) * self._spacing if count else 0
+
+    def shape(self, text: str) -> Tuple[GlyphBuffer, Optional[str]]:
+        """Merge the glyphs of text, reusing shaped runs between spaces.
+
+        Args:
+            text (str): Text.
+
+        Returns:
+            Tuple[GlyphBuffer, Optional[str]]: Merged glyphs and last char or ligature.
+        """
+        glyphs = self.split(text)
+        fragment: Optional[GlyphBuffer] = None
+        last: Optional[str] = None
+        count = 0
+        idx = 0
+        while idx < len(glyphs):
+            if glyphs[idx] != " " and (last is None or last == " "):
+                end = idx
+                while end < len(glyphs) and glyphs[end] != " ":
+                    end += 1
+                shaped, after_space = self._shape_run(glyphs[idx:end])
+                # Blank lines of a run are widened by whatever precedes it, which
+                # only keeps kerning unchanged if it adds no negative spacing.
+                if fragment is None:
+                    fragment = shaped.copy()
+                elif after_space and self._spacing + min(fragment.trail) >= 0:
+                    fragment.merge(shaped, self._spacing)
+                else:
+                    fragment, last, count, _ = self._merge(
+                        fragment, last, count, glyphs[idx:end]
+                    )
+                    idx = end
+                    continue
+                count += end - idx
+                last = glyphs[end - 1]
+                idx = end
+            else:
+                fragment, last, count, _ = self._merge(
+                    fragment, last, count, glyphs[idx : idx + 1]
+                )
+                idx += 1
+        if fragment is None:
+            fragment = GlyphBuffer(self._font.line_height)
+        return fragment, last
+
+    def _run(self, run: str, glyphs: Optional[List[str]] = None) -> ShapedRun:
+        typography = self._typography
+        key = (
+            self._font,
+            typography.adjust_spacing,
+            typography.use_kerning,
+            typography.use_ligatures,
+            run,
+        )
+        shaped = shape_cache.get(key)
+        if shaped is None:
+            if glyphs is None:
+                glyphs = self.split(run)
+            width = sum(self._font.glyph_width(d) for d in glyphs)
+            for left, right in zip(glyphs[:-1], glyphs[1:]):
+                width += typography.letter_adjust(left, right)
+            shaped = ShapedRun(width)
+            shape_cache.put(key, shaped)
+        return shaped
+
+    def _shape_run(self, glyphs: List[str]) -> Tuple[GlyphBuffer, bool]:
+        shaped = self._run("".join(glyphs), glyphs)
+        shape = shaped.shape
+        if shape is None:
+            buffer, _, _, after_space = self._merge(None, None, 0, glyphs, True)
+            shape = (buffer, after_space)
+            shaped.shape = shape
+        return shape
+
+    def _merge(
+        self,
+        fragment: Optional[GlyphBuffer],
+        last: Optional[str],
+        count: int,
+        glyphs: List[str],
+        check_space: bool = False,
+    ) -> Tuple[GlyphBuffer, Optional[str], int, bool]:
+        # Glyphs after a space see blank lines of the fragment widened by the space and
+        # whatever precedes it. The result holds there if every overlap is limited by
+        # lines that are not blank, and no overlap reaches past the fragment.
+        after_space = True
+        for char in glyphs:
+            letter = self._font.get_buffer(char)
+            if fragment is None:
+                fragment = letter
+            else:
+                spacing = self._spacing
+                if self._typography._should_overlap(last, char):
+                    # Kerning pairs only hold against a single glyph, since
+                    # earlier glyphs of a fragment may overhang the last one.
+                    if count == 1:
+                        overlap = self._font.kerning(last, char)  # type: ignore[arg-type]
+                    else:
+                        overlap = fragment.max_overlap(letter)
+                    spacing -= overlap
+                    if check_space and after_space:
+                        width = fragment.width
+                        after_space = overlap == min(
+                            (
+                                trail + right
+                                for lead, trail, right in zip(
+                                    fragment.lead, fragment.trail, letter.lead
+                                )
+                                if lead < width
+                            ),
+                            default=None,
+                        )
+                if check_space and -spacing > min(fragment.width, letter.width):
+                    after_space = False
+                fragment.merge(letter, spacing)
+            last = char
+            count += 1
+        return fragment, last, count, after_space  # type: ignore[return-value]
@@ -0,0 +1,99 @@
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, NamedTuple
+
+PhaseCallback = Callable[[str, float, Dict[str, int]], None]
+"""Callback receiving phase name, duration in seconds and sizes of the traced work."""
+
+
+class PhaseEvent(NamedTuple):
+    """A traced phase of wrapping or rendering."""
+
+    phase: str
+    """Name of the phase."""
+    duration: float
+    """Duration in seconds."""
+    sizes: Dict[str, int]
+    """Sizes of the traced work, like number of chars or fragments."""
+
+
+_callbacks: List[PhaseCallback] = []
+
+enabled = False
+"""Whether any callback is registered. Phases are only timed while enabled."""
+
+
+def add_callback(callback: PhaseCallback) -> None:
+    """Register a callback for traced phases.
+
+    Args:
+        callback (PhaseCallback): Callback receiving phase name, duration and sizes.
+    """
+    global enabled
+    _callbacks.append(callback)
+    enabled = True
+
+
+def remove_callback(callback: PhaseCallback) -> None:
+    """Unregister a callback for traced phases.
+
+    Args:
+        callback (PhaseCallback): Previously registered callback.
+    """
+    global enabled
+    _callbacks.remove(callback)
+    enabled = bool(_callbacks)
+
+
+@contextmanager
+def trace() -> Iterator[List[PhaseEvent]]:
+    """Collect traced phases while in context.
+    Renders served from the render cache skip the pipeline and are not traced.
+
+    Yields:
+        List[PhaseEvent]: Events, appended as phases finish.
+    """
+    events: List[PhaseEvent] = []
+
+    def collect(phase: str, duration: float, sizes: Dict[str, int]) -> None:
+        events.append(PhaseEvent(phase, duration, sizes))
+
+    add_callback(collect)
+    try:
+        yield events
+    finally:
+        remove_callback(collect)
+
+
+class PhaseTimer:
+    """Accumulates durations of phases between laps and reports them to all callbacks."""
+
+    def __init__(self) -> None:
+        self._start = perf_counter()
+        self._durations: Dict[str, float] = {}
+
+    def lap(self, phase: str) -> None:
+        """Add the time since the previous lap to a phase.
+
+        Args:
+            phase (str): Name of the phase.
+        """
+        now = perf_counter()
+        self._durations[phase] = self._durations.get(phase, 0.0) + now - self._start
+        self._start = now
+
+    def skip(self) -> None:
+        """Exclude the time since the previous lap from all phases."""
+        self._start = perf_counter()
+
+    def emit(self, **sizes: int) -> None:
+        """Report accumulated phases to all callbacks and reset them.
+
+        Args:
+            **sizes (int): Sizes of the traced work.
+        """
+        for phase, duration in self._durations.items():
+            for callback in list(_callbacks):
+                callback(phase, duration, sizes)
+        self._durations = {}
+        self._start = perf_counter()
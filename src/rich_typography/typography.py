@@ -1,31 +1,46 @@
-import re
 import bisect
 
 from pathlib import Path
 from dataclasses import dataclass
 from functools import partial
-from typing import Dict, Iterable, List, Literal, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from rich.color import ColorType
-from rich.console import (
-    Console,
-    ConsoleOptions,
-    JustifyMethod,
-    OverflowMethod,
-    RenderResult,
-)
-from rich.containers import Lines
 from rich.control import strip_control_codes
 from rich.segment import Segment
 from rich.style import Style
-from rich.text import Span, Text
-from rich.emoji import EmojiVariant
 from rich.jupyter import JupyterMixin
-from rich.measure import Measurement
 
+from rich_typography import tracing
+from rich_typography.cache import render_cache, sizeof_segments
 from rich_typography.font import Font
-from rich_typography.glyph import Glyphs
+from rich_typography.glyph import GlyphBuffer
 from rich_typography.line import LineStyle
+from rich_typography.shaping import Shaper
+from rich_typography.wrap import WordWrap
+
+if TYPE_CHECKING:
+    # Deferred, since rich.console and rich.text take longer to import than this package
+    from rich.console import (
+        Console,
+        ConsoleOptions,
+        JustifyMethod,
+        OverflowMethod,
+        RenderResult,
+    )
+    from rich.emoji import EmojiVariant
+    from rich.measure import Measurement
+    from rich.text import Span, Text
 
 LigatureStyleMethod = Literal["first", "last"]
 
@@ -33,6 +48,9 @@ NON_OVERLAPPING = " \"'"
 DEFAULT_FONT = "condensedsemi"
 DEFAULT_JUSTIFY: "JustifyMethod" = "default"
 DEFAULT_OVERFLOW: "OverflowMethod" = "fold"
+MAX_CACHED_RENDER = 64 * 1024
+"""Estimated memory in bytes of rendered output that is still collected for the render cache.
+Larger output is streamed, holding only the rows of one wrapped line at a time."""
 LINE_STYLE_RESET = Style(
     underline=False,
     underline2=False,
@@ -124,7 +142,7 @@ class Typography(JupyterMixin):
         overflow: Optional["OverflowMethod"] = None,
         no_wrap: Optional[bool] = None,
         tab_size: Optional[int] = None,
-        spans: Optional[List[Span]] = None,
+        spans: Optional[List["Span"]] = None,
         font: Union[Path, str, Font] = "condensedsemi",
         adjust_spacing: int = 0,
         use_kerning: bool = True,
@@ -139,7 +157,7 @@ class Typography(JupyterMixin):
         self.overflow: Optional["OverflowMethod"] = overflow
         self.no_wrap = no_wrap
         self.tab_size = tab_size
-        self._spans: List[Span] = spans or []
+        self._spans: List["Span"] = spans or []
         if isinstance(font, Font):
             self.font = font
         else:
@@ -167,6 +185,8 @@ class Typography(JupyterMixin):
             old_length = self._length
             self._length = len(sanitized_text)
             if old_length > self._length:
+                from rich.text import Span
+
                 self._spans[:] = [
                     (
                         span
@@ -178,12 +198,12 @@ class Typography(JupyterMixin):
                 ]
 
     @property
-    def spans(self) -> List[Span]:
+    def spans(self) -> List["Span"]:
         """Get a reference to the internal list of spans."""
         return self._spans
 
     @spans.setter
-    def spans(self, spans: List[Span]) -> None:
+    def spans(self, spans: List["Span"]) -> None:
         """Set spans."""
         self._spans = spans[:]
 
@@ -199,7 +219,7 @@ class Typography(JupyterMixin):
         """
         value = self.font.letter_spacing + self.adjust_spacing
         if self.use_kerning and left != " " and right != " ":
-            value -= Glyphs.max_overlap(*map(self.font.get, [left, right]))
+            value -= self.font.kerning(left, right)
         return value
 
     # OPERATOR OVERRIDES
@@ -222,6 +242,8 @@ class Typography(JupyterMixin):
         return self.plain == other.plain and self._spans == other._spans
 
     def __contains__(self, other: object) -> bool:
+        from rich.text import Text
+
         if isinstance(other, str):
             return other in self.plain
         elif isinstance(other, Text):
@@ -250,7 +272,7 @@ class Typography(JupyterMixin):
     @classmethod
     def from_text(
         cls,
-        text: Text,
+        text: "Text",
         *,
         font: Union[Path, str, Font] = "condensedsemi",
         adjust_spacing: int = 0,
@@ -293,7 +315,7 @@ class Typography(JupyterMixin):
         *,
         style: Union[str, Style] = "",
         emoji: bool = True,
-        emoji_variant: Optional[EmojiVariant] = None,
+        emoji_variant: Optional["EmojiVariant"] = None,
         justify: Optional["JustifyMethod"] = None,
         overflow: Optional["OverflowMethod"] = None,
         font: Union[Path, str, Font] = "condensedsemi",
@@ -320,6 +342,8 @@ class Typography(JupyterMixin):
         Returns:
             Typography: A Typography instance with markup rendered.
         """
+        from rich.text import Text
+
         return cls.from_text(
             Text.from_markup(
                 text,
@@ -336,12 +360,14 @@ class Typography(JupyterMixin):
             style_ligatures=style_ligatures,
         )
 
-    def to_text(self) -> Text:
+    def to_text(self) -> "Text":
         """Create Text instance from Typography.
 
         Returns:
             Text: A Text instance based on Typography.
         """
+        from rich.text import Text
+
         return Text(
             self.plain,
             style=self.style,
@@ -361,47 +387,50 @@ class Typography(JupyterMixin):
         Returns:
             int: Length of rendered text.
         """
-
-        def glyph_width(c: str) -> int:
-            return len(self.font.get(c)[0])
-
-        if not text:
-            return 0
-        glyphs = list(self.split_glyphs(text).values())
-        width = glyph_width(glyphs[0])
-        for a, b in zip(glyphs[:-1], glyphs[1:]):
-            width += glyph_width(b) + self.letter_adjust(a, b)
-        return width
+        return Shaper(self).width(text)
 
     def split_glyphs(self, text: str) -> Dict[int, str]:
         """Splits text into individual glyphs, based on the available ligatures in the font.
 
         Args:
-            text (str): _description_
+            text (str): Text.
 
         Returns:
-            Dict[int, str]: _description_
+            Dict[int, str]: Chars or ligatures by their offset in text.
         """
         if not self.use_ligatures:
             return dict(enumerate(text))
-        glyphs: Dict[int, str] = {}
-        last = 0
-        if not self.font.ligatures:
-            return dict(enumerate(text))
-        ligatures = reversed(sorted(self.font.ligatures, key=len))
-        for ligature in re.finditer("|".join(ligatures), text):
-            start, end = ligature.span()
-            glyphs |= dict(enumerate(text[last:start], last))
-            glyphs[start] = text[start:end]
-            last = end
-        glyphs |= dict(enumerate(text[last:], last))
-        return glyphs
+        borders = self.font.glyph_borders(text)
+        return {
+            start: text[start:end]
+            for start, end in zip(borders, borders[1:] + [len(text)])
+        }
+
+    def prefix_widths(self, text: str) -> Dict[int, int]:
+        """Get the rendered width of every prefix of text that ends on a glyph border.
+
+        Args:
+            text (str): Text.
+
+        Returns:
+            Dict[int, int]: Rendered width by end offset of prefix.
+        """
+        result: Dict[int, int] = {}
+        width = 0
+        last = None
+        for start, glyph in self.split_glyphs(text).items():
+            width += self.font.glyph_width(glyph)
+            if last is not None:
+                width += self.letter_adjust(last, glyph)
+            result[start + len(glyph)] = width
+            last = glyph
+        return result
 
     def truncate(
         self,
         max_width: int,
         *,
-        overflow: Optional[OverflowMethod],
+        overflow: Optional["OverflowMethod"],
     ) -> None:
         """Truncate text if it is longer than a given width.
 
@@ -409,12 +438,6 @@ class Typography(JupyterMixin):
             max_width (int): Maximum number of characters in text.
             overflow (str, optional): Overflow method: "crop", "fold", or "ellipsis". Defaults to None, to use self.overflow.
         """
-
-        def set_cell_size(text: str, width: int) -> str:
-            while self.rendered_width(text) > width:
-                text = text[:-1]
-            return text
-
         _overflow = overflow or self.overflow or DEFAULT_OVERFLOW
         length = self.rendered_width(self.plain)
         if _overflow == "ignore" or length <= max_width:
@@ -422,9 +445,11 @@ class Typography(JupyterMixin):
         if _overflow == "ellipsis":
             ellipsis = "…" if "…" in self.font else "..."
             max_width -= self.rendered_width(ellipsis)
-            self.plain = set_cell_size(self.plain, max_width) + ellipsis
+            self.plain = (
+                self.plain[: self._fit_offset(self.plain, max_width)] + ellipsis
+            )
         else:
-            self.plain = set_cell_size(self.plain, max_width)
+            self.plain = self.plain[: self._fit_offset(self.plain, max_width)]
 
     def wrap(
         self,
@@ -445,35 +470,68 @@ class Typography(JupyterMixin):
         Returns:
             Iterable[Typography]: Typography for each line.
         """
+        return list(
+            self.iter_wrap(width, overflow=overflow, tab_size=tab_size, no_wrap=no_wrap)
+        )
+
+    def iter_wrap(
+        self,
+        width: int,
+        *,
+        overflow: Optional["OverflowMethod"] = None,
+        tab_size: int = 8,
+        no_wrap: Optional[bool] = None,
+    ) -> Iterator["Typography"]:
+        """Word wrap the text, laying out one line of the text at a time.
+        Only the current line is held in memory, so large texts can be rendered as they are wrapped.
+
+        Args:
+            width (int): Number of cells available per line.
+            overflow (str, optional): Overflow method: "crop", "fold", or "ellipsis". Defaults to None.
+            tab_size (int, optional): Default tab size. Defaults to 8.
+            no_wrap (bool, optional): Disable wrapping, Defaults to False.
+
+        Yields:
+            Typography: Typography for each line.
+        """
         wrap_overflow = overflow or self.overflow or DEFAULT_OVERFLOW
         no_wrap = bool(no_wrap or self.no_wrap) or wrap_overflow == "ignore"
-        lines = Lines()
-        text = self.to_text()
-        for line in text.split(allow_blank=True):
+
+        timer = tracing.PhaseTimer() if tracing.enabled else None
+        word_wrap = WordWrap(self)
+        count = 0
+        for line in self.split_lines():
             if "\t" in line:
                 line.expand_tabs(tab_size)
             if no_wrap:
-                new_lines = [line]
+                new_lines: Iterable["Text"] = [line]
             else:
-                offsets = self._divide_offsets(
+                offsets = word_wrap.iter_offsets(
                     str(line), width, wrap_overflow == "fold"
                 )
-                new_lines = line.divide(offsets)
-            lines.extend(new_lines)
-        typography_lines = [
-            Typography.from_text(
-                line,
-                font=self.font,
-                adjust_spacing=self.adjust_spacing,
-                use_kerning=self.use_kerning,
-                use_ligatures=self.use_ligatures,
-                style_ligatures=self.style_ligatures,
-            )
-            for line in lines
-        ]
-        for line in typography_lines:
-            line.truncate(width, overflow=overflow)
-        return typography_lines
+                new_lines = self._divide(line, offsets)
+            if timer:
+                timer.lap("divide")
+            for new_line in new_lines:
+                typography = Typography.from_text(
+                    new_line,
+                    font=self.font,
+                    adjust_spacing=self.adjust_spacing,
+                    use_kerning=self.use_kerning,
+                    use_ligatures=self.use_ligatures,
+                    style_ligatures=self.style_ligatures,
+                )
+                if timer:
+                    timer.lap("lines")
+                typography.truncate(width, overflow=overflow)
+                if timer:
+                    timer.lap("truncate")
+                count += 1
+                yield typography
+                if timer:
+                    timer.skip()
+        if timer:
+            timer.emit(chars=len(self.plain), lines=count)
 
     # RENDERING
 
@@ -507,9 +565,13 @@ class Typography(JupyterMixin):
         # wrap_overflow = overflow or self.overflow or DEFAULT_OVERFLOW
         line_height = self.font.line_height
         letter_spacing = self.font.letter_spacing
+        shaper = Shaper(self)
+        timer = tracing.PhaseTimer() if tracing.enabled else None
         for line in self.plain.splitlines():
             # Align style borders to glyphs
             fragments = self._style_fragments(line, console)
+            if timer:
+                timer.lap("style_fragments")
             # Right-strip if appropriate for justify method
             if wrap_justify in ["right", "center", "justify"]:
                 line = line.rstrip()
@@ -517,6 +579,8 @@ class Typography(JupyterMixin):
             # Note: we do this here, because the length of a rendered space can
             # be other than 1, and indents cannot be expressed in text spaces.
             line_width = self.rendered_width(line)
+            if timer:
+                timer.lap("measure")
             if wrap_justify == "right":
                 indent = int(width - line_width)
             elif wrap_justify == "center":
@@ -526,54 +590,46 @@ class Typography(JupyterMixin):
             # Adjust style borders
             if wrap_justify == "full":
                 fragments = self._justify_full(width, line, fragments)
+            if timer:
+                timer.lap("style_fragments")
             # Prepapre accumulators and apply indents
             row_spans = [[MutableSpan(0, 0, None)] for _ in range(line_height)]
-            row_chars = ["" + " " * indent] * line_height
+            row_buffer = GlyphBuffer(line_height, indent)
             last_char = ""
             last_style = None
             for fragment_text, fragment_style in fragments:
                 if not fragment_text:
                     continue
-                if self.use_ligatures:
-                    segment_chars = list(self.split_glyphs(fragment_text).values())
-                else:
-                    segment_chars = list(fragment_text)
                 # Render fragment
-                fragment = []
-                fragment_char = None
-                for char in segment_chars:
-                    letter = self.font.get(char)
-                    if fragment_char is None:
-                        fragment = letter
-                    else:
-                        spacing = letter_spacing + self.adjust_spacing
-                        if self._should_overlap(fragment_char, char):
-                            spacing -= Glyphs.max_overlap(fragment, letter)
-                        fragment = Glyphs.merge(fragment, letter, spacing)
-                    fragment_char = char
+                fragment, fragment_char = shaper.shape(fragment_text)
+                if timer:
+                    timer.lap("shape")
                 fragment_spacing = letter_spacing + self.adjust_spacing
                 if self._should_overlap(last_char, fragment_text[0]):
-                    fragment_spacing -= Glyphs.max_overlap(row_chars, fragment)
+                    fragment_spacing -= row_buffer.max_overlap(fragment)
                 last_char = fragment_char
                 # Determine if styles overlap
                 split_styles = (
                     has_background(fragment_style) or has_background(last_style)
                 ) and fragment_spacing != 0
                 # Calculate offsets
-                fg_offsets = Glyphs.boundary(row_chars, fragment, fragment_spacing)
-                bg_offsets = Glyphs.bg_boundary(row_chars, fragment, fragment_spacing)
+                row_width = row_buffer.width
+                fg_offsets = row_buffer.boundary(fragment, fragment_spacing)
+                bg_offsets = row_buffer.bg_boundary(fragment, fragment_spacing)
+                if timer:
+                    timer.lap("boundary")
                 if split_styles:
                     # Add mixed styles for overlap
                     for d in range(len(row_spans)):
-                        row_spans[d][-1].end = len(row_chars[d]) + min(
+                        row_spans[d][-1].end = row_width + min(
                             fg_offsets[d], bg_offsets[d]
                         )
                         # Row overlaps segment
                         if fg_offsets[d] > bg_offsets[d]:
                             row_spans[d].append(
                                 MutableSpan(
-                                    len(row_chars[d]) + bg_offsets[d],
-                                    len(row_chars[d]) + fg_offsets[d],
+                                    row_width + bg_offsets[d],
+                                    row_width + fg_offsets[d],
                                     self._overlay_styles(last_style, fragment_style),
                                 )
                             )
@@ -581,32 +637,36 @@ class Typography(JupyterMixin):
                         elif fg_offsets[d] < bg_offsets[d]:
                             row_spans[d].append(
                                 MutableSpan(
-                                    len(row_chars[d]) + fg_offsets[d],
-                                    len(row_chars[d]) + bg_offsets[d],
+                                    row_width + fg_offsets[d],
+                                    row_width + bg_offsets[d],
                                     self._overlay_styles(fragment_style, last_style),
                                 )
                             )
                 else:
                     for d in range(len(row_spans)):
-                        row_spans[d][-1].end = len(row_chars[d]) + fg_offsets[d]
+                        row_spans[d][-1].end = row_width + fg_offsets[d]
                 for d in range(len(row_spans)):
                     row_spans[d].append(
                         MutableSpan(
-                            len(row_chars[d])
+                            row_width
                             + (
                                 max(bg_offsets[d], fg_offsets[d])
                                 if split_styles
                                 else fg_offsets[d]
                             ),
-                            len(row_chars[d]) + len(fragment[d]),
+                            row_width + fragment.width,
                             fragment_style,
                         )
                     )
+                if timer:
+                    timer.lap("spans")
                 # Add current letter/ligature to result
-                row_chars = Glyphs.merge(row_chars, fragment, fragment_spacing)
+                row_buffer.merge(fragment, fragment_spacing)
                 last_style = fragment_style
+                if timer:
+                    timer.lap("merge")
             # Truncate
-            row_chars = [row[:width] for row in row_chars]
+            row_chars = [row[:width] for row in row_buffer.lines]
             # Right-pad if appropriate for justify method
             if wrap_justify and wrap_justify != "default":
                 row_chars = [row + " " * (width - len(row)) for row in row_chars]
@@ -615,11 +675,18 @@ class Typography(JupyterMixin):
                 row.append(MutableSpan(row[-1].end, len(row_chars[0]), Style.null()))
             # Resolve span overlap
             row_spans = [MutableSpan.resolve(spans) for spans in row_spans]
-            # Render result
+            if timer:
+                timer.lap("resolve")
+            # Render result, merging adjacent fragments of equal style
+            segments = []
             for row_num, (row, spans) in enumerate(zip(row_chars, row_spans)):
+                pending = ""
+                pending_style: Optional[Style] = None
                 for span in spans:
                     style: Optional[Style] = span.style
                     fragment = row[span.start : span.end]
+                    if not fragment:
+                        continue
                     if style:
                         style_override = LINE_STYLE_RESET
                         for line in ["underline", "underline2", "overline", "strike"]:
@@ -637,119 +704,219 @@ class Typography(JupyterMixin):
                                 override = {_line: True}
                                 style_override += Style(*{}, **override)
                         style += style_override
-                    yield (Segment(fragment, style=style))
-                yield Segment("\n")
+                    if pending and style == pending_style:
+                        pending += fragment
+                        continue
+                    if pending:
+                        segments.append(Segment(pending, style=pending_style))
+                    pending, pending_style = fragment, style
+                if pending:
+                    segments.append(Segment(pending, style=pending_style))
+                segments.append(Segment("\n"))
+            if timer:
+                timer.lap("segments")
+                timer.emit(
+                    chars=sum(len(text) for text, _ in fragments),
+                    fragments=len(fragments),
+                    width=row_buffer.width,
+                    segments=len(segments),
+                )
+            yield from segments
+            if timer:
+                timer.skip()
 
-    def __rich_console__(
-        self, console: Console, options: ConsoleOptions
-    ) -> RenderResult:
+    def split_lines(self) -> Iterator["Text"]:
+        """Split the text at hard line breaks, one line at a time.
+
+        Returns:
+            Iterator[Text]: Text for each line, with the spans within that line.
+        """
+        return self._split_lines(self.to_text())
+
+    def render_lines(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> Iterator[List[Segment]]:
+        """Render the text without the render cache, one wrapped line at a time.
+        Each line only depends on its own text, so lines split with `split_lines` can be rendered in isolation.
+
+        Args:
+            console (Console): Console instance.
+            options (ConsoleOptions): Console options.
+
+        Yields:
+            List[Segment]: Segments of all rows of a wrapped line, with new lines.
+        """
         tab_size = console.tab_size if self.tab_size is None else self.tab_size
         no_wrap = bool(self.no_wrap or options.no_wrap)
         justify = self.justify or options.justify or DEFAULT_JUSTIFY
         overflow = self.overflow or options.overflow or DEFAULT_OVERFLOW
-        lines: Iterable["Typography"] = self.wrap(
+        lines = self.iter_wrap(
             width=options.max_width,
             tab_size=tab_size or 8,
             no_wrap=no_wrap,
             overflow=overflow,
         )
         for line in lines:
-            yield from line.render(
-                console=console,
-                width=options.max_width,
-                justify=justify,
-                overflow=overflow,
+            yield list(
+                line.render(
+                    console=console,
+                    width=options.max_width,
+                    justify=justify,
+                    overflow=overflow,
+                )
             )
 
+    def __rich_console__(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> "RenderResult":
+        if not render_cache.enabled:
+            for line_segments in self.render_lines(console, options):
+                yield from line_segments
+            return
+        key = self._render_key(console, options)
+        cached = render_cache.get(key)
+        if cached is not None:
+            yield from cached
+            return
+        # Rows are yielded as they are rendered, and only collected for the
+        # cache while they stay small, so large texts are truly streamed
+        segments: Optional[List[Segment]] = []
+        size = 0
+        max_memory = MAX_CACHED_RENDER
+        if render_cache.max_memory is not None:
+            max_memory = min(max_memory, render_cache.max_memory)
+        for line_segments in self.render_lines(console, options):
+            yield from line_segments
+            if segments is None:
+                continue
+            size += sizeof_segments(line_segments)
+            if size > max_memory:
+                segments = None
+            else:
+                segments.extend(line_segments)
+        if segments is not None:
+            render_cache.put(key, segments)
+
     def __rich_measure__(
         self, console: "Console", options: "ConsoleOptions"
-    ) -> Measurement:
-        glyphs = set(
-            re.findall("|".join(self.font.ligatures), self.plain) + list(self.plain)
-        )
-        minimum = max(self.rendered_width(g) for g in glyphs)
+    ) -> "Measurement":
+        from rich.measure import Measurement
+
+        glyphs = set(self.split_glyphs(self.plain).values()) | set(self.plain)
+        minimum = max((self.rendered_width(g) for g in glyphs), default=0)
         return Measurement(minimum, self.rendered_width(self.plain))
 
     # PRIVATE
 
-    def _chop_cells(self, text: str, width: int) -> Iterable[str]:
-        result = []
-        lst, curr = 0, 1
-        while curr < len(text):
-            while curr < len(text) and self.rendered_width(text[lst:curr]) <= width:
-                curr += 1
-            result.append(text[lst:curr])
-            lst = curr
-        if lst < curr:
-            result.append(text[lst:curr])
-        return result
+    @classmethod
+    def _split_lines(cls, text: "Text") -> Iterator["Text"]:
+        # Splits like Text.split(allow_blank=True), but one line at a time
+        plain = text.plain
+        if "\n" not in plain:
+            yield text.copy()
+            return
 
-    def _divide_offsets(
-        self,
-        text: str,
-        width: int,
-        fold: bool,
-    ) -> Iterable[int]:
-        offsets = []
-        space_length = self.font.space_width
-        offset = 0
-        length = 0
-        for word in text.split(" "):
-            remaining = width - length - space_length
-            word_length = self.rendered_width(word)
-            if word_length > remaining:
-                if (
-                    fold
-                    and word_length > width
-                    and self.rendered_width(word[0]) <= remaining
-                ):
-                    fold_offset = 1
-                    while self.rendered_width(word[: fold_offset + 1]) <= remaining:
-                        fold_offset += 1
-                    part = word[:fold_offset]
-                    part_length = self.rendered_width(part)
-                    if offset > 0:
-                        offset += 1
-                    offset += fold_offset
-                    if length > 0:
-                        length += space_length
-                    length += part_length
-                    for part in self._chop_cells(word[fold_offset:], width):
-                        offsets.append(offset)
-                        offset += len(part)
-                        length = self.rendered_width(part)
-                else:
-                    if length > 0 or not word:
-                        length += space_length
-                    length = word_length
-                    if offset > 0 or not word:
-                        offset += 1
-                    offsets.append(offset)
-                    offset += len(word)
-            else:
-                if length > 0 or not word:
-                    length += space_length
-                length += word_length
-                if offset > 0 or not word:
-                    offset += 1
-                offset += len(word)
-        offsets.append(offset)
-        return offsets
+        def ranges() -> Iterator[Tuple[int, int]]:
+            start = 0
+            while start <= len(plain):
+                end = plain.find("\n", start)
+                if end == -1:
+                    end = len(plain)
+                yield start, end
+                start = end + 1
+
+        yield from cls._slice_text(text, ranges())
+
+    @classmethod
+    def _divide(cls, text: "Text", offsets: Iterable[int]) -> Iterator["Text"]:
+        # Divides like Text.divide with at least one offset, but one line at a time
+        def ranges() -> Iterator[Tuple[int, int]]:
+            start = 0
+            for offset in offsets:
+                yield start, offset
+                start = offset
+            yield start, len(text.plain)
+
+        return cls._slice_text(text, ranges())
+
+    @classmethod
+    def _slice_text(
+        cls, text: "Text", ranges: Iterable[Tuple[int, int]]
+    ) -> Iterator["Text"]:
+        # Spans are sorted by start once, and only those reaching into a range are
+        # clipped to it, in their original order
+        from rich.text import Span, Text
+
+        plain = text.plain
+        spans = sorted(enumerate(text.spans), key=lambda d: d[1].start)
+        active: List[Tuple[int, "Span"]] = []
+        next_span = 0
+        for start, end in ranges:
+            while next_span < len(spans) and spans[next_span][1].start < end:
+                active.append(spans[next_span])
+                next_span += 1
+            active = [d for d in active if d[1].end > start]
+            line = Text(
+                plain[start:end],
+                style=text.style,
+                justify=text.justify,
+                overflow=text.overflow,
+            )
+            for _, span in sorted(active):
+                span_start, span_end = max(span.start, start), min(span.end, end)
+                if span_end > span_start:
+                    line.spans.append(
+                        Span(span_start - start, span_end - start, span.style)
+                    )
+            yield line
+
+    def _render_key(self, console: "Console", options: "ConsoleOptions") -> Tuple:
+        # Styles are resolved, since names depend on the theme of the console
+        get_style = partial(console.get_style, default=Style.null())
+        return (
+            self.plain,
+            tuple((d.start, d.end, get_style(d.style)) for d in self._spans),
+            get_style(self.style),
+            self.justify,
+            self.overflow,
+            self.no_wrap,
+            self.tab_size,
+            self.font,
+            self.adjust_spacing,
+            self.use_kerning,
+            self.use_ligatures,
+            self.style_ligatures,
+            options.max_width,
+            options.no_wrap,
+            options.justify,
+            options.overflow,
+            console.tab_size,
+        )
+
+    def _fit_offset(self, text: str, width: int) -> int:
+        prefixes = self.prefix_widths(text)
+        ends = list(prefixes)
+        widths = list(prefixes.values())
+        # Negative spacing and kerning can shrink widths, so find the last prefix that fits
+        count = len(widths)
+        while count and widths[count - 1] > width:
+            count -= 1
+        offset = ends[count - 1] if count else 0
+        # Prefixes cutting into a ligature are split into different glyphs
+        if count < len(ends):
+            for end in range(ends[count] - 1, offset, -1):
+                if self.rendered_width(text[:end]) <= width:
+                    return end
+        return offset
 
     def _glyph_borders(self, text: str) -> List[int]:
-        result = list(range(len(text)))
-        if not (self.use_ligatures and self.font.ligatures):
-            return result
-        ligatures = reversed(sorted(self.font.ligatures, key=len))
-        for ligature in re.finditer("|".join(ligatures), text):
-            start, end = ligature.span()
-            for d in range(start + 1, end):
-                result.remove(d)
-        return result
+        if not self.use_ligatures:
+            return list(range(len(text)))
+        return self.font.glyph_borders(text)
 
     def _style_borders(
         self,
-        console: Console,
+        console: "Console",
         width: int,
     ) -> List[Tuple[int, Optional[Style]]]:
         def combine_styles(styles: Iterable[Union[Style, str]]) -> Optional[Style]:
@@ -786,7 +953,7 @@ class Typography(JupyterMixin):
         return result
 
     def _style_fragments(
-        self, text: str, console: Console
+        self, text: str, console: "Console"
     ) -> List[Tuple[str, Optional[Style]]]:
         def neighbours(
             numbers: List[int], target: int
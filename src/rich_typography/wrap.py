@@ -0,0 +1,145 @@
+from typing import TYPE_CHECKING, Iterator, List, Tuple
+
+from rich_typography.shaping import Shaper
+
+if TYPE_CHECKING:
+    from rich_typography.typography import Typography
+
+
+class WordWrap:
+    """Word wrap engine, which measures text in a single pass with running widths.
+
+    Args:
+        typography (Typography): Typography providing font and spacing settings.
+    """
+
+    def __init__(self, typography: "Typography") -> None:
+        self._typography = typography
+        self._font = typography.font
+        self._shaper = Shaper(typography)
+
+    def running_widths(self, text: str, start: int = 0) -> Iterator[int]:
+        """Yield the rendered width of text from start up to every following offset.
+
+        Args:
+            text (str): Text.
+            start (int, optional): Start offset. Defaults to 0.
+
+        Yields:
+            int: Rendered width of text[start:end] for end = start + 1 onwards.
+        """
+        typography = self._typography
+        use_ligatures = typography.use_ligatures
+        width = 0
+        last = None
+        pos = start
+        while pos < len(text):
+            end = self._font.match_glyph(text, pos) if use_ligatures else pos + 1
+            # Cutting into a ligature renders its chars as separate glyphs
+            for cut in range(pos + 1, end):
+                partial = text[pos:cut]
+                partial_width = typography.rendered_width(partial)
+                if last is not None:
+                    first = partial[: self._font.match_glyph(partial)]
+                    partial_width += width + typography.letter_adjust(last, first)
+                yield partial_width
+            glyph = text[pos:end]
+            width += self._font.glyph_width(glyph)
+            if last is not None:
+                width += typography.letter_adjust(last, glyph)
+            yield width
+            last = glyph
+            pos = end
+
+    def divide_offsets(self, text: str, width: int, fold: bool) -> List[int]:
+        """Calculate the offsets at which text is divided into lines.
+
+        Args:
+            text (str): Text.
+            width (int): Number of cells available per line.
+            fold (bool): Fold words longer than a line.
+
+        Returns:
+            List[int]: Offsets of line breaks.
+        """
+        return list(self.iter_offsets(text, width, fold))
+
+    def iter_offsets(self, text: str, width: int, fold: bool) -> Iterator[int]:
+        """Calculate the offsets at which text is divided into lines, one line at a time.
+        Words are measured as they are reached, so the first offset is found without measuring the whole text.
+
+        Args:
+            text (str): Text.
+            width (int): Number of cells available per line.
+            fold (bool): Fold words longer than a line.
+
+        Yields:
+            int: Offset of the next line break.
+        """
+        space_length = self._font.space_width
+        offset = 0
+        length = 0
+        for word in self._split_words(text):
+            remaining = width - length - space_length
+            word_length = self._shaper.measure(word)
+            if word_length > remaining:
+                # Prefix widths are only needed to fold words longer than a line
+                folding = fold and word_length > width
+                prefixes = [0, *self.running_widths(word)] if folding else []
+                if folding and prefixes[1] <= remaining:
+                    fold_offset = 1
+                    while prefixes[fold_offset + 1] <= remaining:
+                        fold_offset += 1
+                    if offset > 0:
+                        offset += 1
+                    offset += fold_offset
+                    if length > 0:
+                        length += space_length
+                    length += prefixes[fold_offset]
+                    for part_end, part_length in self._chop_cells(
+                        word, fold_offset, width
+                    ):
+                        yield offset
+                        offset = offset - fold_offset + part_end
+                        fold_offset = part_end
+                        length = part_length
+                else:
+                    length = word_length
+                    if offset > 0 or not word:
+                        offset += 1
+                    yield offset
+                    offset += len(word)
+            else:
+                if length > 0 or not word:
+                    length += space_length
+                length += word_length
+                if offset > 0 or not word:
+                    offset += 1
+                offset += len(word)
+        yield offset
+
+    @classmethod
+    def _split_words(cls, text: str) -> Iterator[str]:
+        # Splits like str.split(" "), but one word at a time
+        start = 0
+        while True:
+            end = text.find(" ", start)
+            if end == -1:
+                yield text[start:]
+                return
+            yield text[start:end]
+            start = end + 1
+
+    def _chop_cells(
+        self, text: str, start: int, width: int
+    ) -> Iterator[Tuple[int, int]]:
+        # Parts keep the first char exceeding the width, which is cropped later on
+        last = start
+        while last < len(text):
+            end = last
+            length = 0
+            for end, length in enumerate(self.running_widths(text, last), last + 1):
+                if length > width or end == len(text):
+                    break
+            yield end, length
+            last = end
@@ -0,0 +1,48 @@
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+from rich.console import Console
+
+from tests.fonts import OVERLAP
+
+from rich_typography import Typography, iter_lines_async, render_lines_async
+
+TEXT = "office fira\nfox " * 5
+
+
+def test_render_lines_async() -> None:
+    console = Console(file=io.StringIO(), width=20, legacy_windows=False)
+    typography = Typography(TEXT, font=OVERLAP, style="red")
+    expected = console.render_lines(typography, pad=False)
+    assert expected == asyncio.run(
+        render_lines_async(console, typography, rows_per_yield=1)
+    )
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert expected == asyncio.run(
+            render_lines_async(console, typography, executor=executor)
+        )
+
+
+def test_iter_lines_async() -> None:
+    console = Console(file=io.StringIO(), width=20, legacy_windows=False)
+    typography = Typography(TEXT, font=OVERLAP)
+    ticks = []
+
+    async def tick() -> None:
+        while True:
+            ticks.append(len(lines))
+            await asyncio.sleep(0)
+
+    async def render() -> None:
+        task = asyncio.create_task(tick())
+        async for line in iter_lines_async(console, typography, rows_per_yield=2):
+            lines.append(line)
+            if len(lines) == 10:
+                break
+        task.cancel()
+
+    lines: list = []
+    asyncio.run(render())
+    assert 10 == len(lines)
+    assert [2, 4, 6, 8] == ticks[:4], "Failed to yield to the event loop."
@@ -0,0 +1,44 @@
+import io
+
+from rich.console import Console
+
+from tests.fonts import OVERLAP
+
+from rich_typography import BatchItem, Typography, render_batch
+
+
+def test_render_batch() -> None:
+    console = Console(file=io.StringIO(), width=40, legacy_windows=False)
+    items = [
+        "fox",
+        BatchItem("[red]office[/] fira", style="bold", markup=True, width=20),
+        BatchItem("fox", options={"font": OVERLAP, "justify": "right"}),
+        "fox",
+    ]
+    expected = [
+        console.render_lines(Typography("fox"), pad=False),
+        console.render_lines(
+            Typography.from_markup("[red]office[/] fira", style="bold"),
+            console.options.update_width(20),
+            pad=False,
+        ),
+        console.render_lines(
+            Typography("fox", font=OVERLAP, justify="right"), pad=False
+        ),
+        console.render_lines(Typography("fox"), pad=False),
+    ]
+    assert expected == render_batch(console, items)
+    assert expected == render_batch(console, items, max_workers=2)
+    result = render_batch(console, items)
+    assert result[0] == result[3] and result[0] is not result[3]
+    assert result[0][0] is not result[3][0], "Failed to copy rows of equal items."
+    assert result[0][0][0] is result[3][0][0], "Failed to render equal items once."
+    result[0][0].clear()
+    assert expected[3] == result[3]
+
+
+def test_render_batch_default_options() -> None:
+    assert BatchItem("fox").options is None
+    console = Console(file=io.StringIO(), width=40, legacy_windows=False)
+    expected = console.render_lines(Typography("fox"), pad=False)
+    assert [expected] == render_batch(console, [BatchItem("fox", options=None)])
@@ -0,0 +1,104 @@
+import shutil
+from pathlib import Path
+
+from pytest import MonkeyPatch
+
+from tests.fonts import OVERLAP
+from tests.utilities.render import render_ansi
+
+from rich_typography import Font, Typography
+from rich_typography.cache import FontCache, LRUCache, render_cache
+
+FONT_FOLDER = Path(__file__).parent / "fonts"
+
+
+def test_lru_cache() -> None:
+    cache: LRUCache[str] = LRUCache(max_entries=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert "A" == cache.get("a")
+    cache.put("c", "C")
+    assert "b" not in cache, "Failed to evict least recently used value."
+    assert "a" in cache and "c" in cache
+    assert (1, 0, 1) == (cache.hits, cache.misses, cache.evictions)
+    assert cache.get("b") is None
+    assert 1 == cache.misses
+
+
+def test_lru_cache_memory() -> None:
+    cache: LRUCache[str] = LRUCache(max_memory=10, sizeof=len)
+    cache.put("a", "AAAA")
+    cache.put("b", "BBBB")
+    assert 8 == cache.memory
+    cache.put("c", "CCCC")
+    assert ["b", "c"] == [d for d in ["a", "b", "c"] if d in cache]
+    cache.put("d", "D" * 11)
+    assert "d" not in cache, "Failed to skip value exceeding memory limit."
+    cache.max_memory = 4
+    assert 1 == len(cache)
+    cache.clear()
+    assert 0 == len(cache) and 0 == cache.memory
+
+
+def test_lru_cache_disabled() -> None:
+    cache: LRUCache[str] = LRUCache(enabled=False)
+    cache.put("a", "A")
+    assert cache.get("a") is None
+    assert 0 == len(cache)
+
+
+def test_render_cache() -> None:
+    render_cache.clear()
+    typography = Typography("forty", font=OVERLAP, style="red")
+    expected = render_ansi(typography, width=20)
+    assert 1 == len(render_cache)
+    hits = render_cache.hits
+    assert expected == render_ansi(typography, width=20)
+    assert hits + 1 == render_cache.hits, "Failed to render from cache."
+    render_ansi(typography, width=21)
+    typography.plain = "fort"
+    render_ansi(typography, width=21)
+    assert 3 == len(render_cache), "Failed to separate cache keys."
+    render_cache.enabled = False
+    try:
+        assert expected == render_ansi(
+            Typography("forty", font=OVERLAP, style="red"), width=20
+        )
+        assert 3 == len(render_cache)
+    finally:
+        render_cache.enabled = True
+
+
+def test_render_cache_streaming() -> None:
+    render_cache.clear()
+    typography = Typography("forty\nfort\nfor", font=OVERLAP, style="red")
+    expected = render_ansi(typography, width=20)
+    assert 1 == len(render_cache)
+    render_cache.clear()
+    max_memory = render_cache.max_memory
+    render_cache.max_memory = 1000
+    try:
+        assert expected == render_ansi(typography, width=20)
+        assert 0 == len(render_cache), "Failed to skip output exceeding cache."
+    finally:
+        render_cache.max_memory = max_memory
+    large = Typography("forty\n" * 200, font=OVERLAP, style="red")
+    render_ansi(large, width=20)
+    assert 0 == len(render_cache), "Failed to stream large output without caching."
+
+
+def test_font_cache(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    path = tmp_path / "simple.toff"
+    shutil.copy(FONT_FOLDER / "simple.toff", path)
+    monkeypatch.chdir(tmp_path)
+    cache = FontCache(max_entries=2)
+    monkeypatch.setattr("rich_typography.font.font_cache", cache)
+    font = Font.from_file(path)
+    assert font is Font.from_file("simple.toff"), "Failed to normalize path."
+    assert (1, 1) == (cache.hits, cache.misses)
+    assert cache.load_time > 0
+    with open(path, "a", encoding="utf-8") as file:
+        file.write("\n")
+    assert font is not Font.from_file(path), "Failed to reload changed file."
+    Font.preload("condensedsans", path, lazy=True)
+    assert 1 == cache.evictions
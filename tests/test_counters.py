@@ -0,0 +1,29 @@
+from tests.fonts import OVERLAP
+from tests.utilities.render import render_ansi
+
+import rich_typography
+from rich_typography import Typography
+from rich_typography.cache import render_cache, shape_cache
+
+
+def test_stats() -> None:
+    render_cache.clear()
+    shape_cache.clear()
+    rich_typography.reset_stats()
+    stats = rich_typography.stats()
+    assert 0 == stats["glyph_lookups"] and 0 == stats["render_cache.hits"]
+    OVERLAP._kerning.clear()
+    typography = Typography("office €", font=OVERLAP)
+    render_ansi(typography, width=40)
+    render_ansi(typography, width=40)
+    stats = rich_typography.stats()
+    assert stats["glyph_lookups"] > 0
+    assert stats["placeholder_fallbacks"] > 0, "Failed to count missing glyph."
+    assert stats["ligature_matches"] >= 1, "Failed to count ligature 'ffi'."
+    assert stats["kerning_computations"] > 0
+    assert 1 == stats["render_cache.hits"] and 1 == stats["render_cache.misses"]
+    assert stats["shape_cache.misses"] > 0
+    rich_typography.reset_stats()
+    stats = rich_typography.stats()
+    assert 0 == stats["ligature_matches"] and 0 == stats["render_cache.hits"]
+    assert 1 == stats["render_cache.entries"], "Failed to keep cached values."
@@ -1,6 +1,10 @@
 import string
 from pathlib import Path
+
+import pytest
+
 from rich_typography import Font, Glyphs, LineStyle
+from rich_typography.registry import builtin_fonts, find_font
 
 FONT_FOLDER = Path(__file__).parent / "fonts"
 
@@ -71,3 +75,114 @@ def test_from_file() -> None:
     for char in ["ä", "ö", "ü", "ß"]:
         assert char in font
     assert font.ligatures == ["re", "ra", "ri", "ro", "ru", "fi", "ff", "ft", "ffi"]
+
+
+def test_kerning() -> None:
+    font = Font.from_file(FONT_FOLDER / "simple.toff")
+    assert font.kerning("f", "o") == Glyphs.max_overlap(font.get("f"), font.get("o"))
+    assert font.kerning("ff", "o") == Glyphs.max_overlap(font.get("ff"), font.get("o"))
+    assert ("f", "o") in font._kerning, "Failed to cache kerning pair."
+
+
+def test_glyph_borders() -> None:
+    font = Font.from_file(FONT_FOLDER / "simple.toff")
+    assert font.glyph_borders("") == []
+    assert font.glyph_borders("abc") == [0, 1, 2]
+    assert font.glyph_borders("office") == [0, 1, 4, 5], (
+        "Failed to match longest ligature."
+    )
+    assert font.glyph_borders("offer") == [0, 1, 3, 4], "Failed to match ligatures."
+    font = Font(
+        "Special Ligatures",
+        Glyphs.from_lines("a.", "╭╮ ·"),
+        ligatures=Glyphs.from_lines(["a.", ".*"], "╭╮· ·*"),
+    )
+    assert font.glyph_borders("a..*a") == [0, 2, 4], "Failed to match literally."
+
+
+def test_lazy_font() -> None:
+    source = Font.from_file(FONT_FOLDER / "simple.toff")
+    font = Font.from_file(FONT_FOLDER / "simple.toff", lazy=True)
+    assert [" "] == list(font._atlas), "Failed to defer decoding sections."
+    assert "ä" in font and "A" in font and "ffi" in font
+    assert source.get("a") == font.get("a"), "Failed to load section on first use."
+    assert "b" in font._atlas and "A" not in font._atlas
+    assert source.get("ffi") == font.get("ffi"), "Failed to load ligatures."
+    assert source.kerning("f", "A") == font.kerning("f", "A")
+    assert sorted(str(source).split("\n")) == sorted(str(font).split("\n"))
+    assert not font._pending
+
+
+def test_font_without_glyphs(tmp_path: Path) -> None:
+    path = tmp_path / "empty.toff"
+    path.write_text(
+        "[header]\nname: Empty\n\n[ligatures]\nsequences: ff\nglyphs:\n  ╭╭\n",
+        encoding="utf-8",
+    )
+    for lazy in [False, True]:
+        with pytest.raises(ValueError, match="empty.toff has no glyph sections"):
+            Font.from_file(path, lazy=lazy)
+
+
+def test_compiled_font(tmp_path: Path) -> None:
+    source = Font.from_file(FONT_FOLDER / "simple.toff")
+    source.save(tmp_path / "simple.tofc")
+    font = Font.from_file(tmp_path / "simple.tofc")
+    assert str(source) == str(font), "Failed to restore glyphs."
+    assert source.name == font.name
+    assert source.baseline == font.baseline
+    assert source.underline == font.underline
+    assert source.underline2 == font.underline2
+    assert source.ligatures == font.ligatures
+    for left in source._atlas:
+        for right in source._atlas:
+            assert source.kerning(left, right) == font.kerning(left, right), (
+                f"Failed to restore kerning of {left!r} and {right!r}."
+            )
+    assert font.get("€") == source.get("€"), "Failed to restore placeholder."
+    font._atlas.add(source.get("a"), "€")
+    assert source.get("a") == font.get("€"), "Failed to add to loaded atlas."
+
+
+def test_close_compiled_font(tmp_path: Path) -> None:
+    source = Font.from_file(FONT_FOLDER / "simple.toff")
+    source.save(tmp_path / "simple.tofc")
+    font = Font._from_compiled(tmp_path / "simple.tofc")
+    mapping = font._mapping
+    assert mapping is not None and not mapping.closed
+    font.close()
+    assert mapping.closed, "Failed to unmap compiled font."
+    assert str(source) == str(font), "Failed to keep glyphs after closing."
+    assert source.kerning("ff", "o") == font.kerning("ff", "o")
+    font.close()
+
+
+def test_compiled_builtin_fonts() -> None:
+    for name in builtin_fonts():
+        path = find_font(name)
+        assert path is not None and ".tofc" == path.suffix, (
+            f"Font {name} is not precompiled."
+        )
+        source = Font.from_file(path.with_suffix(".toff"))
+        assert str(source) == str(Font.from_file(name)), f"Font {name} is outdated."
+
+
+def test_subset() -> None:
+    source = Font.from_file(FONT_FOLDER / "simple.toff")
+    font = source.subset(["fire", "office"])
+    assert ["f", "i", "r", "e", "o", "c"] == [d for d in "fireoc" if d in font]
+    assert "a" not in font and "ä" not in font
+    assert ["re", "ri", "ro", "fi", "ff", "ffi"] == font.ligatures
+    assert source.get("ffi") == font.get("ffi")
+    assert font.get("a") == font.get("€"), "Failed to keep placeholder."
+    assert source.kerning("ff", "o") == font.kerning("ff", "o")
+
+
+def test_subset_kerning() -> None:
+    source = Font.from_file("condensedsans")
+    font = source.subset("0123456789:")
+    assert 12 == len(font._atlas)
+    assert len(font._atlas) + 1 == font._kerning_size
+    for left in "0:1":
+        for right in "0:1":
+            assert source.kerning(left, right) == font.kerning(left, right)
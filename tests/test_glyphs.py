@@ -1,6 +1,7 @@
 import pytest
 from tests.utilities.markup import MarkupResult
 from rich_typography import Glyphs
+from rich_typography.glyph import GlyphAtlas, GlyphBuffer
 
 
 def test_simple_glyphs() -> None:
@@ -130,3 +131,57 @@ def test_repr() -> None:
         "        ",
     )
     assert "<Glyphs: a b c>" == glyphs.__repr__()
+
+
+def test_glyph_buffer() -> None:
+    glyphs = Glyphs.from_lines(
+        "abc",
+        "   ╷    ",
+        "┌╮ ├╮ ╭┐",
+        "╭┤ ││ │ ",
+        "╰┘ └╯ ╰╴",
+        "        ",
+    )
+    buffer = GlyphBuffer(5, 1)
+    expected = [" "] * 5
+    for char, spacing in zip("abc", [0, -1, 1]):
+        glyph = glyphs[char]
+        other = GlyphBuffer.from_glyph(glyph)
+        assert Glyphs.max_overlap(expected, glyph) == buffer.max_overlap(other)
+        assert Glyphs.boundary(expected, glyph, spacing) == buffer.boundary(
+            other, spacing
+        )
+        buffer.merge(other, spacing)
+        expected = Glyphs.merge(expected, glyph, spacing)
+        assert expected == buffer.lines, f"Failed to merge glyph {char}."
+    assert len(expected[0]) == buffer.width
+
+
+def test_glyph_atlas() -> None:
+    glyphs = Glyphs.from_lines(
+        "abc",
+        "   ╷    ",
+        "┌╮ ├╮ ╭┐",
+        "╭┤ ││ │ ",
+        "╰┘ └╯ ╰╴",
+        "        ",
+    )
+    atlas = GlyphAtlas(5)
+    ids = {char: atlas.add(glyph, char) for char, glyph in glyphs.items()}
+    assert len(atlas) == 3
+    assert "b" in atlas
+    assert atlas.get_id("d") is None
+    for char, glyph in glyphs.items():
+        assert glyph == atlas.glyph(ids[char]), f"Failed to return glyph {char}."
+        assert len(glyph[0]) == atlas.width(ids[char])
+    assert [2, 0, 0, 0, 2] == list(atlas.lead(ids["a"]))
+    assert [1, 0, 0, 0, 2] == list(atlas.trail(ids["b"]))
+    assert Glyphs.max_overlap(glyphs["b"], glyphs["c"]) == atlas.max_overlap(
+        ids["b"], ids["c"]
+    )
+    buffer = atlas.buffer(ids["a"])
+    buffer.merge(atlas.buffer(ids["b"]))
+    assert glyphs["a"] == atlas.glyph(ids["a"]), "Merging changed decoded glyph."
+    assert glyphs["a"] == atlas.buffer(ids["a"]).lines
+    with pytest.raises(ValueError):
+        atlas.add(["  "], "d")
@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+
+def imported_modules(statement: str) -> set:
+    result = subprocess.run(
+        [sys.executable, "-c", f"{statement}\nimport sys\nprint(*sys.modules)"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_lazy_package() -> None:
+    modules = imported_modules("import rich_typography")
+    assert "rich_typography.typography" not in modules
+    assert "rich_typography.font" not in modules
+
+
+def test_deferred_imports() -> None:
+    modules = imported_modules("from rich_typography import Font, Typography")
+    for module in ["rich.console", "rich.text", "configparser"]:
+        assert module not in modules, f"Failed to defer import of {module}."
@@ -0,0 +1,52 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from tests.fonts import OVERLAP
+from tests.utilities.render import render_ansi
+
+from rich_typography import ParallelTypography, Typography
+
+MARKUP = "\n".join(
+    [
+        "[red]office [bold]fira[/]",
+        "",
+        "fox[/]\tfox",
+        "[on blue]the quick brown fox jumps over the lazy dog[/]",
+    ]
+    * 4
+)
+
+
+class FailingExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        raise AssertionError("Failed to render in a single process.")
+
+
+def test_parallel_render() -> None:
+    typography = Typography.from_markup(MARKUP, font="condensedsemi")
+    for justify in ["left", "full", "right"]:
+        expected = render_ansi(typography, width=50, justify=justify)  # type: ignore[arg-type]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parallel = ParallelTypography(typography, min_chars=0, executor=executor)
+            assert expected == render_ansi(parallel, width=50, justify=justify)  # type: ignore[arg-type]
+
+
+def test_parallel_render_processes() -> None:
+    typography = Typography.from_markup(MARKUP, font="condensedsemi", justify="full")
+    expected = render_ansi(typography, width=60)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = ParallelTypography(typography, min_chars=0, executor=executor)
+        assert expected == render_ansi(parallel, width=60)
+
+
+def test_parallel_render_fallback() -> None:
+    executor = FailingExecutor()
+    short = Typography.from_markup(MARKUP, font="condensedsemi")
+    expected = render_ansi(short, width=50)
+    parallel = ParallelTypography(short, min_chars=len(MARKUP) + 1, executor=executor)
+    assert expected == render_ansi(parallel, width=50)
+    in_memory = Typography.from_markup(MARKUP, font=OVERLAP)
+    expected = render_ansi(in_memory, width=50)
+    parallel = ParallelTypography(in_memory, min_chars=0, executor=executor)
+    assert expected == render_ansi(parallel, width=50), (
+        "Failed to skip font without path."
+    )
@@ -0,0 +1,77 @@
+from importlib.metadata import EntryPoint
+from pathlib import Path
+from typing import Dict, Iterator
+
+import pytest
+from pytest import MonkeyPatch
+
+from rich_typography import Font
+from rich_typography import registry
+
+FONT_FOLDER = Path(__file__).parent / "fonts"
+
+FONTS = {
+    "simple": FONT_FOLDER / "simple.toff",
+    "condensedsans": FONT_FOLDER / "simple.toff",
+}
+
+
+def provide_fonts() -> Dict[str, Path]:
+    return FONTS
+
+
+@pytest.fixture
+def plugin(monkeypatch: MonkeyPatch) -> Iterator[None]:
+    entry_point = EntryPoint(
+        "simple", "tests.test_registry:provide_fonts", registry.ENTRY_POINT_GROUP
+    )
+    monkeypatch.setattr("importlib.metadata.entry_points", lambda group: [entry_point])
+    registry.plugin_fonts.cache_clear()
+    yield
+    registry.plugin_fonts.cache_clear()
+
+
+def test_builtin_fonts() -> None:
+    assert {
+        "condensedsans",
+        "condensedsemi",
+        "condensedserif",
+        "extended.condensedsans",
+        "extended.sans",
+    } == set(registry.builtin_fonts())
+    for name in registry.builtin_fonts():
+        path = registry.find_font(name)
+        assert path is not None and path.exists()
+    assert registry.find_font("missing") is None
+
+
+def test_plugin_fonts(plugin: None) -> None:
+    assert {"simple": FONT_FOLDER / "simple.toff"} == registry.plugin_fonts()
+    assert "simple" in Font.get_font_names()
+    assert "Simple Test Font" == Font.from_file("simple").name
+    assert "Simple Test Font" != Font.from_file("condensedsans").name, (
+        "Failed to prefer builtin font."
+    )
+
+
+def broken_fonts() -> Dict[str, Path]:
+    raise ImportError("Broken font package.")
+
+
+def test_broken_plugin(monkeypatch: MonkeyPatch) -> None:
+    entry_points = [
+        EntryPoint("broken", "tests.test_registry:broken_fonts", "group"),
+        EntryPoint("simple", "tests.test_registry:provide_fonts", "group"),
+    ]
+    monkeypatch.setattr("importlib.metadata.entry_points", lambda group: entry_points)
+    registry.plugin_fonts.cache_clear()
+    try:
+        assert registry.find_font(str(FONT_FOLDER / "simple.toff")) is None
+        assert registry.find_font("simple.tofc") is None
+        assert registry.plugin_fonts.cache_info().currsize == 0, (
+            "Failed to skip plugins for file paths."
+        )
+        with pytest.warns(RuntimeWarning, match="'broken'"):
+            assert FONTS["simple"] == registry.find_font("simple")
+    finally:
+        registry.plugin_fonts.cache_clear()
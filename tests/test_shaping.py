@@ -0,0 +1,27 @@
+from tests.fonts import OVERLAP
+
+from rich_typography import Typography
+from rich_typography.cache import shape_cache
+from rich_typography.shaping import Shaper
+
+
+def test_shaper_width() -> None:
+    typography = Typography("", font=OVERLAP)
+    shaper = Shaper(typography)
+    assert 0 == shaper.measure("")
+    widths = {"office": 9, "fira  office": 16, " re ": 5, "c-S office": 17}
+    for text, width in widths.items():
+        assert width == shaper.width(text), f"Failed to measure {text!r}."
+        buffer, _ = shaper.shape(text)
+        assert width == buffer.width, f"Failed to shape {text!r}."
+
+
+def test_shaper_cache() -> None:
+    shape_cache.clear()
+    shaper = Shaper(Typography("", font=OVERLAP))
+    first, last = shaper.shape("office office")
+    assert "e" == last
+    hits = shape_cache.hits
+    second, _ = shaper.shape("office office")
+    assert first.lines == second.lines
+    assert shape_cache.hits > hits, "Failed to reuse shaped run."
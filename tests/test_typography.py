@@ -2,8 +2,9 @@ from tests.utilities.asserts import assert_markup
 from tests.fonts import OVERLAP
 from tests.utilities.markup import MarkupResult
 
-from rich.text import Text
-from rich_typography import Typography
+from rich.console import Console
+from rich.text import Span, Text
+from rich_typography import Typography, tracing
 
 
 def test_overlap() -> None:
@@ -210,6 +211,25 @@ def test_overflow_ignore() -> None:
     )
 
 
+def test_prefix_widths() -> None:
+    typography = Typography("fira", font=OVERLAP)
+    assert {2: 2, 4: 5} == typography.prefix_widths("fira")
+    typography = Typography("fira", font=OVERLAP, use_ligatures=False)
+    assert {1: 2, 2: 3, 3: 5, 4: 7} == typography.prefix_widths("fira")
+
+
+def test_truncate() -> None:
+    typography = Typography("office", font=OVERLAP)
+    typography.truncate(6, overflow="crop")
+    assert "offi" == typography.plain
+    typography = Typography("fira", font=OVERLAP)
+    typography.truncate(4, overflow="crop")
+    assert "fir" == typography.plain, "Failed to truncate within ligature."
+    typography = Typography("lIfuq-.c.f", font="extended.sans", adjust_spacing=-1)
+    typography.truncate(9, overflow="ellipsis")
+    assert "lIfuq-...." == typography.plain, "Failed to truncate shrinking widths."
+
+
 def test_no_wrap() -> None:
     text = "Voluptates nihil cumque nemo pariatur veniam"
     expected = MarkupResult(
@@ -588,3 +608,77 @@ def test_ligature_style_last() -> None:
         Text.from_markup(markup), font=OVERLAP, style_ligatures="last"
     )
     assert_markup(result, expected)
+
+
+def test_tracing() -> None:
+    typography = Typography.from_markup(
+        "[on red]office[/] fira\nfox", font=OVERLAP, justify="full"
+    )
+    assert not tracing.enabled
+    with tracing.trace() as events:
+        assert tracing.enabled
+        lines = typography.wrap(10)
+        for line in lines:
+            list(line.render(Console(), 10))
+    assert not tracing.enabled, "Failed to disable tracing."
+    phases = [d.phase for d in events]
+    for phase in ["divide", "lines", "truncate"]:
+        assert phase in phases
+    rendered = [line for line in lines if line.plain]
+    for phase in ["style_fragments", "shape", "boundary", "merge", "resolve"]:
+        assert len(rendered) == phases.count(phase), f"Failed to trace {phase}."
+    assert {"chars": 3, "fragments": 1, "width": 5, "segments": 15} == events[-1].sizes
+    assert all(d.duration >= 0 for d in events)
+
+
+def test_iter_wrap() -> None:
+    typography = Typography.from_markup(
+        "[red]office [bold]fira[/]\n\nfox[/] fox", font=OVERLAP
+    )
+    lines = typography.iter_wrap(10)
+    first = next(lines)
+    assert "office " == first.plain
+    assert [Span(0, 7, "red")] == first.spans
+    expected = typography.wrap(10)
+    assert [first, *lines] == expected
+    assert ["office ", "fira", "", "", "", "fox ", "fox", ""] == [
+        d.plain for d in expected
+    ]
+    assert [Span(0, 4, "red"), Span(0, 4, "bold")] == expected[1].spans
+    assert [Span(0, 3, "red")] == expected[5].spans
+
+
+def test_split_lines() -> None:
+    text = Text.from_markup("[red]office [bold]fira\n\nfox[/] fox\n")
+    typography = Typography.from_text(text, font=OVERLAP)
+    assert list(text.split(allow_blank=True)) == list(typography.split_lines())
+
+
+def test_render_lines() -> None:
+    console = Console(width=40)
+    typography = Typography.from_markup("[red]office[/]\nfox fox", font=OVERLAP)
+    rendered = [
+        segment
+        for line in typography.split_lines()
+        for segments in Typography.from_text(line, font=OVERLAP).render_lines(
+            console, console.options
+        )
+        for segment in segments
+    ]
+    assert list(console.render(typography)) == rendered
+
+
+def test_coalesce_segments() -> None:
+    typography = Typography.from_markup("[red]of[/][red]fi[/]ce fox", font=OVERLAP)
+    segments = list(typography.render(Console(), 40))
+    rows: list = [[]]
+    for segment in segments:
+        assert segment.text, "Failed to drop empty segment."
+        if segment.text == "\n":
+            rows.append([])
+        else:
+            rows[-1].append(segment)
+    for row in rows:
+        styles = [d.style for d in row]
+        assert all(a != b for a, b in zip(styles, styles[1:]))
+    assert len(rows[0]) == 2, "Failed to merge equal styles."
@@ -0,0 +1,41 @@
+from pytest import MonkeyPatch
+
+from tests.fonts import OVERLAP
+
+from rich_typography import Typography
+from rich_typography.wrap import WordWrap
+
+
+def test_running_widths() -> None:
+    typography = Typography("", font=OVERLAP)
+    wrap = WordWrap(typography)
+    text = "office fira"
+    assert [typography.rendered_width(text[:end]) for end in range(1, 12)] == list(
+        wrap.running_widths(text)
+    )
+    assert [typography.rendered_width(text[3:end]) for end in range(4, 12)] == list(
+        wrap.running_widths(text, 3)
+    ), "Failed to measure from offset."
+
+
+def test_divide_offsets() -> None:
+    wrap = WordWrap(Typography("", font=OVERLAP))
+    text = "Voluptates nihil cumque nemo pariatur veniam"
+    assert [0, 11, 17, 24, 29, 38, 44] == wrap.divide_offsets(text, 13, False)
+    assert [7, 17, 24, 29, 38, 44] == wrap.divide_offsets(text, 13, True)
+
+
+def test_iter_offsets(monkeypatch: MonkeyPatch) -> None:
+    wrap = WordWrap(Typography("", font=OVERLAP))
+    text = "Voluptates nihil cumque nemo pariatur veniam"
+    assert wrap.divide_offsets(text, 13, True) == list(
+        wrap.iter_offsets(text, 13, True)
+    )
+    measured = []
+    measure = wrap._shaper.measure
+    monkeypatch.setattr(
+        wrap._shaper, "measure", lambda word: measured.append(word) or measure(word)
+    )
+    offsets = wrap.iter_offsets(text, 13, False)
+    assert [0, 11] == [next(offsets), next(offsets)]
+    assert ["Voluptates", "nihil"] == measured, "Failed to measure words lazily."